@@ -53,7 +53,14 @@ TEXT_WIDGET_HEIGHT = 15
 INFO_LABEL_WIDTH = 40
 INFO_LABEL_HEIGHT = 6
 
+# Boards with at least this many cells are drawn on a single Canvas instead of one Label per cell.
+CANVAS_BOARD_MIN_CELLS = 2500
+CANVAS_CELL_SIZE = 26  # pixels per cell on the Canvas board
+CANVAS_BOARD_MAX_VIEW = 800  # largest visible Canvas board size in pixels; larger boards scroll
+FONT_CANVAS_CELL = (FONT_FAMILY, 8)
+
 TIMER_DELAY_MS = 1000
+LOG_MAX_LINES = 500  # the game log widget keeps only the most recent lines
 
 
 
@@ -0,0 +1,48 @@
+# actions.py
+"""
+Summary of what the current player can do right now.
+Game.get_available_actions() builds one AvailableActions per player and state version,
+so the action buttons, the targeting modes and GameEngine share the same target sets
+instead of each recomputing reachability and scanning asteroids.
+"""
+from constants import manhattan_distance
+
+ROBOT_PLANT_COST = 100
+DEBRIS_TORPEDO_COST = 200
+
+
+class AvailableActions:
+    """
+    Read-only snapshot for one player at one state version:
+      - moves, move_error: allowed destinations (frozenset) or the reason the player cannot move
+      - plant_targets, can_plant: asteroid tiles a robot can be planted on, and whether it is affordable
+      - debris_targets, can_deploy_debris: debris torpedo targets, and whether a torpedo is affordable
+      - can_upgrade_robots: some owned robot within range is below the Factory capacity
+      - can_mine: the player has a Drill and stands on an active asteroid
+      - can_hijack: the player stands on an active asteroid carrying another player's robot
+    """
+    def __init__(self, game, player):
+        capabilities = player.capabilities
+        self.player = player
+        self.state_version = game.state_version
+
+        moves, self.move_error = game.get_allowed_moves(player)
+        self.moves = frozenset(moves)
+
+        self.plant_targets = frozenset(game.get_remote_plant_targets(player))
+        self.can_plant = bool(self.plant_targets) and player.money >= ROBOT_PLANT_COST
+
+        self.debris_targets = frozenset(game.get_debris_targets(player))
+        self.can_deploy_debris = bool(self.debris_targets) and player.money >= DEBRIS_TORPEDO_COST
+
+        robot_range, robot_capacity = capabilities.robot_range, capabilities.robot_capacity
+        self.can_upgrade_robots = robot_range is not None and robot_capacity is not None and any(
+            a.robot and a.robot.owner == player and
+            manhattan_distance(player.x, player.y, a.x, a.y) <= robot_range and
+            a.robot.capacity < robot_capacity
+            for a in game.get_robot_asteroids(player)
+        )
+
+        asteroid = game.get_active_asteroid_at(player.x, player.y)
+        self.can_mine = capabilities.mining_capacity is not None and asteroid is not None
+        self.can_hijack = asteroid is not None and asteroid.robot is not None and asteroid.robot.owner != player
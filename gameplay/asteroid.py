@@ -1,6 +1,8 @@
 import random
 import math
 
+import numpy as np
+
 from .robot import Robot
 
 # Define asteroid types and their properties.
@@ -31,27 +33,180 @@ ASTEROID_TYPES = {
     }
 }
 
+# Asteroid types by numeric id, as stored in AsteroidField.type_id.
+ASTEROID_TYPE_NAMES = list(ASTEROID_TYPES.keys())
+ASTEROID_TYPE_IDS = {name: i for i, name in enumerate(ASTEROID_TYPE_NAMES)}
+
+NO_OWNER = -1
+
+
+class AsteroidField:
+    """
+    Structure-of-arrays store for every asteroid of a game.
+    Row i holds asteroid i's position, resource, value, initial resource, type id,
+    robot capacity and robot owner (an index into players, NO_OWNER without a robot),
+    so per-turn updates such as robot mining are whole-column operations.
+    Asteroid objects are lightweight views onto one row.
+    """
+    def __init__(self, players, capacity=16):
+        self.players = players
+        self.owner_ids = {p: i for i, p in enumerate(players)}
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.intp)
+        self.y = np.zeros(capacity, dtype=np.intp)
+        self.resource = np.zeros(capacity, dtype=np.float64)
+        self.initial_resource = np.zeros(capacity, dtype=np.float64)
+        self.value = np.zeros(capacity, dtype=np.float64)
+        self.type_id = np.zeros(capacity, dtype=np.int8)
+        self.robot_capacity = np.zeros(capacity, dtype=np.int64)
+        self.robot_owner = np.full(capacity, NO_OWNER, dtype=np.int16)
+
+    _columns = ("x", "y", "resource", "initial_resource", "value", "type_id", "robot_capacity", "robot_owner")
+
+    def _grow(self):
+        new_capacity = max(16, 2 * len(self.resource))
+        for name in self._columns:
+            old = getattr(self, name)
+            fill = NO_OWNER if name == "robot_owner" else 0
+            new = np.full(new_capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, id, x, y, resource, value, asteroid_type):
+        """Appends an asteroid row and returns its Asteroid view."""
+        if self.count == len(self.resource):
+            self._grow()
+        i = self.count
+        self.count += 1
+        self.x[i] = x
+        self.y[i] = y
+        self.resource[i] = resource
+        self.initial_resource[i] = resource
+        self.value[i] = value
+        self.type_id[i] = ASTEROID_TYPE_IDS[asteroid_type]
+        type_props = ASTEROID_TYPES[asteroid_type]
+        return Asteroid(self, i, id, type_props["color"], type_props["event_probability_override"])
+
+    def column(self, name):
+        """Returns the live (count-sized) slice of a column."""
+        return getattr(self, name)[:self.count]
+
+
+class LensStats:
+    """
+    Normalisation data for the "resource" and "value" lenses, computed once per game state:
+      - ranges: (min_resource, max_resource, min_value, max_value) as logarithms over the
+        discovered active asteroids; undiscovered active asteroids pull both minimums down
+        to at most 100000. All zero if no active asteroid is discovered.
+      - log_resource, log_value: per field row, log of the remaining resource and of the
+        remaining total value (-inf for exhausted asteroids).
+    """
+    def __init__(self, field, discovered):
+        resources = field.column("resource")
+        values = resources * field.column("value")
+        active = resources > 0
+        self.log_resource = np.full(len(resources), -np.inf)
+        self.log_value = np.full(len(resources), -np.inf)
+        np.log(resources, out=self.log_resource, where=active)
+        np.log(values, out=self.log_value, where=active)
+        seen = active & discovered[field.column("x"), field.column("y")]
+        if not seen.any():
+            self.ranges = (0, 0, 0, 0)
+            return
+        min_resource = resources[seen].min()
+        min_value = values[seen].min()
+        if (active & ~seen).any():
+            min_resource = min(min_resource, 100000)
+            min_value = min(min_value, 100000)
+        self.ranges = (math.log(min_resource), math.log(resources[seen].max()),
+                       math.log(min_value), math.log(values[seen].max()))
+
+
+class RobotView:
+    """A robot as seen through its asteroid's row in an AsteroidField."""
+    __slots__ = ("field", "index")
+
+    def __init__(self, field, index):
+        self.field = field
+        self.index = index
+
+    @property
+    def owner(self):
+        return self.field.players[self.field.robot_owner[self.index]]
+
+    @owner.setter
+    def owner(self, player):
+        self.field.robot_owner[self.index] = self.field.owner_ids[player]
+
+    @property
+    def capacity(self):
+        return int(self.field.robot_capacity[self.index])
+
+    @capacity.setter
+    def capacity(self, value):
+        self.field.robot_capacity[self.index] = value
+
+
 class Asteroid:
-    def __init__(self, id, x, y, resource, value, asteroid_type, color, event_probability_override=None):
+    """
+    View onto one row of an AsteroidField.
+    Position, id, color and discovery flags are plain attributes; resource, value and robot
+    read and write the field's columns.
+    """
+    def __init__(self, field, index, id, color, event_probability_override=None):
+        self.field = field
+        self.index = index
         self.id = id
-        self.x = x
-        self.y = y
-        self.resource = float(resource)
-        self.initial_resource = float(resource)
-        self.value = float(value)
-        self.asteroid_type = asteroid_type
+        self.x = int(field.x[index])
+        self.y = int(field.y[index])
         self.color = color
-        self.robot = None
         self.visited = False
         if event_probability_override is not None:
             self.event_probability = event_probability_override
         else:
             self.event_probability = math.exp(-0.001 * self.initial_resource)
 
+    @property
+    def resource(self):
+        return float(self.field.resource[self.index])
+
+    @resource.setter
+    def resource(self, value):
+        self.field.resource[self.index] = value
+
+    @property
+    def initial_resource(self):
+        return float(self.field.initial_resource[self.index])
+
+    @property
+    def value(self):
+        return float(self.field.value[self.index])
+
+    @property
+    def asteroid_type(self):
+        return ASTEROID_TYPE_NAMES[self.field.type_id[self.index]]
+
+    @property
+    def robot(self):
+        if self.field.robot_owner[self.index] == NO_OWNER:
+            return None
+        return RobotView(self.field, self.index)
+
+    @robot.setter
+    def robot(self, robot):
+        """Accepts a Robot (or RobotView) to plant, or None to remove the robot."""
+        if robot is None:
+            self.field.robot_owner[self.index] = NO_OWNER
+            self.field.robot_capacity[self.index] = 0
+        else:
+            self.field.robot_owner[self.index] = self.field.owner_ids[robot.owner]
+            self.field.robot_capacity[self.index] = robot.capacity
+
     def is_exhausted(self):
-        return self.resource <= 0
+        return bool(self.field.resource[self.index] <= 0)
 
-    def discovery(self, player):
+    def discovery(self, player, rng=random):
+        """Applies a random discovery event to player; rng is the game's random stream."""
         events = [
             ("mining", 20),
             ("discovery", 10),
@@ -62,7 +217,7 @@ class Asteroid:
             ("free_robot", 35),
             ("double_upgrade", 5)
         ]
-        event_type = random.choices([etype for etype, weight in events],
+        event_type = rng.choices([etype for etype, weight in events],
                                     weights=[weight for etype, weight in events],
                                     k=1)[0]
         if event_type == "mining":
@@ -101,7 +256,7 @@ class Asteroid:
             factory.robot_capacity += 5
             return f"Your robot capacity increased by 10! {old} -> {factory.robot_capacity}"
         elif event_type == "money":
-            bonus = random.randint(100, 500)
+            bonus = rng.randint(100, 500)
             player.money += bonus
             return f"You received a bonus of ${bonus}!"
         elif event_type == "free_robot":
@@ -115,7 +270,7 @@ class Asteroid:
                 return "A free robot event was triggered—but a robot is already present. No effect."
         elif event_type == "double_upgrade":
             upgrades = ["mining", "discovery", "movement", "robot_range", "robot_capacity"]
-            chosen = random.sample(upgrades, 2)
+            chosen = rng.sample(upgrades, 2)
             messages = []
             for upgrade in chosen:
                 if upgrade == "mining":
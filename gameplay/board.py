@@ -0,0 +1,69 @@
+# board.py
+"""
+Whole-board render data.
+Game.render_board() describes every tile at once as three integer arrays (text, background
+and foreground), whose entries are ids into a StringTable shared by all frames of a game.
+Because the ids are stable, two frames can be compared with array operations and a UI only
+has to touch the tiles whose appearance actually changed.
+"""
+import numpy as np
+
+
+class StringTable:
+    """Interns strings to small integer ids (and back)."""
+    def __init__(self):
+        self.strings = []
+        self.ids = {}
+
+    def intern(self, s):
+        string_id = self.ids.get(s)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(s)
+            self.ids[s] = string_id
+        return string_id
+
+    def __getitem__(self, string_id):
+        return self.strings[string_id]
+
+    def __len__(self):
+        return len(self.strings)
+
+
+class BoardView:
+    """
+    One rendered frame of the board: text, bg and fg are int arrays of shape
+    (grid_width, grid_height), indexed [x, y], holding ids into strings.
+    """
+    def __init__(self, text, bg, fg, strings):
+        self.text = text
+        self.bg = bg
+        self.fg = fg
+        self.strings = strings
+
+    def tile(self, x, y):
+        """Returns (text, bg, fg) of tile (x, y) as strings."""
+        strings = self.strings
+        return strings[self.text[x, y]], strings[self.bg[x, y]], strings[self.fg[x, y]]
+
+    def copy(self):
+        """Independent copy (overlays paint in place)."""
+        return BoardView(self.text.copy(), self.bg.copy(), self.fg.copy(), self.strings)
+
+    def overlay_bg(self, cells, color):
+        """Paints the background of every cell in cells (any iterable of (x, y)) with color."""
+        if not cells:
+            return
+        xs, ys = zip(*cells)
+        self.bg[list(xs), list(ys)] = self.strings.intern(color)
+
+    def changed_cells(self, previous):
+        """
+        Returns the (x, y) cells whose text, bg or fg differ from previous
+        (every cell if previous is None or has a different shape).
+        """
+        if previous is None or previous.text.shape != self.text.shape:
+            changed = np.ones(self.text.shape, dtype=bool)
+        else:
+            changed = (self.text != previous.text) | (self.bg != previous.bg) | (self.fg != previous.fg)
+        return [(x, y) for x, y in np.argwhere(changed).tolist()]
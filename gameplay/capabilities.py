@@ -0,0 +1,82 @@
+# capabilities.py
+"""
+Derived player capabilities.
+A Capabilities snapshot combines a player's modules into the numbers the rules use
+(e.g. Reactor range times the NERVA multiplier, Drill capacity times the IcePenetrator
+multiplier on ice). Player caches one snapshot and rebuilds it only after its modules
+change, so the derivations live here and nowhere else.
+Per-turn counters (robots produced this turn, WarpDrive used this turn) are not
+capabilities and stay on the modules.
+"""
+
+
+class Capabilities:
+    """
+    Read-only snapshot of a player's capabilities. A capability whose module is missing is None:
+      - can_move: the player has a Reactor or a WarpDrive
+      - movement_range: Reactor range, multiplied by the NERVA (0 without a Reactor)
+      - warp_level: WarpDrive level (0 without one)
+      - mining_capacity, ice_mining_capacity: Drill capacity on regular and on ice asteroids
+      - discovery_range: Telescope range
+      - robot_range: LaunchBay range
+      - robot_capacity, robot_production: Factory capacity per robot and robots per turn (production 0 without one)
+      - debris_radius: radius of a debris torpedo (1, plus the ExplosivesLab bonus)
+      - debris_range: how far a torpedo can be fired (None without a LaunchBay)
+    """
+    __slots__ = ("can_move", "movement_range", "warp_level", "mining_capacity", "ice_mining_capacity",
+                 "discovery_range", "robot_range", "robot_capacity", "robot_production",
+                 "debris_radius", "debris_range")
+
+    def __init__(self, player):
+        get = player.get_module
+        drill, telescope, reactor = get("Drill"), get("Telescope"), get("Reactor")
+        launch_bay, factory = get("LaunchBay"), get("Factory")
+        fusion, ice, explosives, warp = get("FusionReactor"), get("IcePenetrator"), get("ExplosivesLab"), get("WarpDrive")
+
+        movement_range = reactor.movement_range if reactor is not None else 0
+        if fusion is not None:
+            movement_range = int(movement_range * fusion.movement_multiplier)
+        mining_capacity = drill.mining_capacity if drill is not None else None
+        ice_mining_capacity = mining_capacity
+        if mining_capacity is not None and ice is not None:
+            ice_mining_capacity = mining_capacity * ice.multiplier
+        robot_range = launch_bay.robot_range if launch_bay is not None else None
+        debris_range = None
+        if robot_range is not None:
+            debris_range = robot_range + 3 + (explosives.extra_range if explosives is not None else 0)
+
+        values = {
+            "can_move": reactor is not None or warp is not None,
+            "movement_range": movement_range,
+            "warp_level": warp.level if warp is not None else 0,
+            "mining_capacity": mining_capacity,
+            "ice_mining_capacity": ice_mining_capacity,
+            "discovery_range": telescope.discovery_range if telescope is not None else None,
+            "robot_range": robot_range,
+            "robot_capacity": factory.robot_capacity if factory is not None else None,
+            "robot_production": factory.robot_production if factory is not None else 0,
+            "debris_radius": 1 + (explosives.debris_radius if explosives is not None else 0),
+            "debris_range": debris_range,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Capabilities are read-only; call Player.invalidate_capabilities() instead.")
+
+    def __eq__(self, other):
+        if not isinstance(other, Capabilities):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, name) for name in self.__slots__))
+
+    def mining_capacity_for(self, asteroid):
+        """Manual mining capacity on the given asteroid (None without a Drill)."""
+        if asteroid.asteroid_type.lower() == "ice":
+            return self.ice_mining_capacity
+        return self.mining_capacity
+
+    def __repr__(self):
+        return "Capabilities(" + ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__) + ")"
@@ -0,0 +1,237 @@
+# engine.py
+"""
+Headless driver for a Game.
+GameEngine owns the turn loop: turn sequencing, robot mining at the end of every turn,
+the WarpDrive free-move rule and confirmation of asteroid events.
+Each player action is a method that acts on the current player and returns an ActionResult,
+so the same rules run under the Tk GUI, in scripts and in simulations.
+"""
+from .log import LogRecord, END_OF_TURN, GAME_OVER
+from .modules import MODULE_CATALOG, MAX_MODULES
+
+
+class ActionResult:
+    """
+    Outcome of one engine action.
+      - success: whether the action was carried out
+      - records: LogRecords produced, in order (including end-of-turn robot mining records);
+        plain strings passed in are wrapped as MESSAGE records
+      - turn_ended: the action consumed the turn and play passed to the next player
+      - game_over: every asteroid is exhausted; no further actions are accepted
+      - event: text of an asteroid discovery event (moves only); the turn stays open
+        until GameEngine.confirm_event() is called
+      - asteroid, path: the asteroid at the destination and the path taken (moves only)
+    """
+    def __init__(self, success, messages=None, turn_ended=False, game_over=False,
+                 event=None, asteroid=None, path=None):
+        self.success = success
+        self.records = [LogRecord.of(m) for m in messages] if messages else []
+        self.turn_ended = turn_ended
+        self.game_over = game_over
+        self.event = event
+        self.asteroid = asteroid
+        self.path = path
+
+    @property
+    def messages(self):
+        """The formatted text of every record."""
+        return [record.format() for record in self.records]
+
+    @property
+    def message(self):
+        return "\n".join(self.messages)
+
+    def __repr__(self):
+        return (f"ActionResult(success={self.success}, turn_ended={self.turn_ended}, "
+                f"game_over={self.game_over}, records={len(self.records)})")
+
+
+class GameEngine:
+    def __init__(self, game, robot_details=False):
+        self.game = game
+        self.robot_details = robot_details  # also log one ROBOT_MINING record per robot each turn
+        self.awaiting_event_confirmation = False
+        self.game_over = False
+        self.game.update_discovered()
+
+    @property
+    def current_player(self):
+        return self.game.get_current_player()
+
+    # -------------------------
+    # Turn sequencing
+    # -------------------------
+    def _blocked(self):
+        """Returns a failed ActionResult if no action may be taken right now, else None."""
+        if self.game_over:
+            return ActionResult(False, ["The game is over."], game_over=True)
+        if self.awaiting_event_confirmation:
+            return ActionResult(False, ["Confirm the asteroid event first."])
+        return None
+
+    def _finish(self, result, end_turn=False):
+        """
+        Optionally ends the turn, records the result in the game log and
+        refreshes discovery so the next query sees the new state.
+        """
+        if end_turn:
+            self._end_turn(result)
+        self.game.game_log.extend(result.records)
+        self.game.update_discovered()
+        return result
+
+    def _end_turn(self, result):
+        game = self.game
+        game.robot_mining(result.records.append, robot_details=self.robot_details)
+        result.records.append(LogRecord(END_OF_TURN, "--- End of Turn {number} ---", game.turn, number=game.turn))
+        result.turn_ended = True
+        if game.is_game_over():
+            result.records.append(LogRecord(GAME_OVER, "All asteroids exhausted. Game over!", game.turn))
+            result.game_over = True
+            self.game_over = True
+            return
+        game.next_turn()
+
+    def confirm_event(self):
+        """Acknowledges a pending asteroid event and ends the turn of the player who triggered it."""
+        if not self.awaiting_event_confirmation:
+            return ActionResult(False, ["No asteroid event to confirm."])
+        self.awaiting_event_confirmation = False
+        return self._finish(ActionResult(True), end_turn=True)
+
+    # -------------------------
+    # Turn actions
+    # -------------------------
+    def move(self, dest):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        success, outcome = self.game.move_player(player, dest)
+        if not success:
+            return ActionResult(False, [outcome])
+        message, event, path, asteroid = outcome
+        result = ActionResult(True, [message], event=event, asteroid=asteroid, path=path)
+        if event:
+            self.awaiting_event_confirmation = True
+            return self._finish(result)
+        warp = player.get_module("WarpDrive")
+        if player.capabilities.warp_level > 1 and asteroid is None and not warp.used_this_turn:
+            # An upgraded WarpDrive gives one free move per turn that does not consume it.
+            warp.used_this_turn = True
+            self.game.modules_changed(player)
+            return self._finish(result)
+        return self._finish(result, end_turn=True)
+
+    def mine(self):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        asteroid = self.game.get_active_asteroid_at(player.x, player.y)
+        if asteroid is None:
+            result = ActionResult(False, ["No asteroid available for mining on this tile."])
+        else:
+            result = ActionResult(True, [self.game.manual_mine(player, asteroid)])
+        # Mining consumes the turn even when nothing could be mined.
+        return self._finish(result, end_turn=True)
+
+    def pass_turn(self):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        return self._finish(ActionResult(True, [f"{self.current_player.symbol} passes."]), end_turn=True)
+
+    def hijack(self):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        message, success = self.game.hijack_robot(self.current_player)
+        return self._finish(ActionResult(success, [message]), end_turn=success)
+
+    # -------------------------
+    # Instant actions (do not consume the turn)
+    # -------------------------
+    def plant_robot(self, cell):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        if cell not in self.game.get_available_actions(player).plant_targets:
+            return ActionResult(False, ["Tile not allowed for planting."])
+        target = self.game.get_asteroid_at(*cell)
+        message, _ = self.game.remote_plant_robot(player, target)
+        planted = target.robot is not None and target.robot.owner == player
+        if planted:
+            player.get_module("Factory").robots_produced_this_turn += 1
+            self.game.modules_changed(player)
+        return self._finish(ActionResult(planted, [message]))
+
+    def deploy_debris(self, cell):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        if cell not in self.game.get_available_actions(player).debris_targets:
+            return ActionResult(False, ["Selected tile is not a valid debris deployment target."])
+        success, message = self.game.deploy_debris(player, cell)
+        return self._finish(ActionResult(success, [message]))
+
+    def upgrade_robots(self):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        messages = self.game.upgrade_all_robots(self.current_player)
+        return self._finish(ActionResult(True, messages))
+
+    def upgrade_module(self, module):
+        """Upgrades one of the current player's modules (a module object or its name)."""
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        if isinstance(module, str):
+            name = module
+            module = player.get_module(name)
+            if module is None:
+                return ActionResult(False, [f"No {name} available to upgrade."])
+        success, message = module.upgrade(player)
+        if success:
+            player.upgrades_purchased += 1
+            self.game.modules_changed(player)
+        return self._finish(ActionResult(success, [message]))
+
+    def buy_module(self, module_name):
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        if module_name not in MODULE_CATALOG:
+            return ActionResult(False, [f"Unknown module {module_name}."])
+        if player.get_module(module_name) is not None:
+            return ActionResult(False, [f"{module_name} is already installed."])
+        if len(player.modules) >= MAX_MODULES:
+            return ActionResult(False, ["No available slot for the module."])
+        new_module = MODULE_CATALOG[module_name]()
+        cost = new_module.build_cost
+        if player.money < cost:
+            return ActionResult(False, ["Insufficient funds to purchase module."])
+        player.money -= cost
+        player.add_module(new_module)
+        self.game.modules_changed(player)
+        return self._finish(ActionResult(True, [f"Purchased {module_name} for ${cost}."]))
+
+    def remove_module(self, module):
+        """Removes one of the current player's modules (a module object or its name)."""
+        blocked = self._blocked()
+        if blocked:
+            return blocked
+        player = self.current_player
+        if isinstance(module, str):
+            name = module
+            module = player.get_module(name)
+            if module is None:
+                return ActionResult(False, [f"No {name} installed."])
+        player.remove_module(module)
+        self.game.modules_changed(player)
+        return self._finish(ActionResult(True, [f"{module.name} has been removed from your modules."]))
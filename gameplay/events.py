@@ -0,0 +1,59 @@
+# events.py
+"""
+Change notifications from Game.
+Every state change publishes a GameEvent on Game.events naming its kind, the tiles whose
+appearance it may have changed and the player concerned, so views can refresh only what
+an action touched instead of redrawing everything.
+"""
+
+# Event kinds
+PLAYER_MOVED = "player_moved"  # cells: old and new position
+RESOURCE_CHANGED = "resource_changed"  # cells: mined asteroids (owners' money changed too)
+ROBOT_CHANGED = "robot_changed"  # cells: the asteroid; action: "planted", "hijacked" or "upgraded"
+DEBRIS_ADDED = "debris_added"  # cells: the debris region
+DISCOVERY_CHANGED = "discovery_changed"  # cells: the stamped discovery diamond
+MODULES_CHANGED = "modules_changed"  # player's modules (or money spent on them) changed
+TURN_ADVANCED = "turn_advanced"  # cells: previous and new current player positions
+
+# Kinds that can change the board (as opposed to player-only state), and with it any view
+# of asteroids or player positions such as the Asteroid Stats window.
+BOARD_KINDS = frozenset({PLAYER_MOVED, RESOURCE_CHANGED, ROBOT_CHANGED, DEBRIS_ADDED,
+                         DISCOVERY_CHANGED, TURN_ADVANCED})
+
+
+class GameEvent:
+    __slots__ = ("kind", "cells", "player", "data")
+
+    def __init__(self, kind, cells=(), player=None, **data):
+        self.kind = kind
+        self.cells = tuple(cells)
+        self.player = player
+        self.data = data
+
+    def __repr__(self):
+        return f"GameEvent({self.kind!r}, cells={len(self.cells)}, player={self.player}, data={self.data!r})"
+
+
+class EventBus:
+    """Synchronous publish/subscribe of GameEvents."""
+    def __init__(self):
+        self.subscribers = []  # (callback, kinds or None)
+
+    def subscribe(self, callback, kinds=None):
+        """
+        Calls callback(event) for every published event (or only those whose kind is in kinds).
+        Returns a function that unsubscribes it.
+        """
+        entry = (callback, frozenset(kinds) if kinds is not None else None)
+        self.subscribers.append(entry)
+
+        def unsubscribe():
+            if entry in self.subscribers:
+                self.subscribers.remove(entry)
+        return unsubscribe
+
+    def publish(self, event):
+        for callback, kinds in list(self.subscribers):
+            if kinds is None or event.kind in kinds:
+                callback(event)
+        return event
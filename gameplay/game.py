@@ -1,28 +1,54 @@
 # game.py
-import math
 import random
 from collections import deque
 
-from fontTools.misc.psOperators import ps_string
-from fontTools.tfmLib import PASSTHROUGH
+import numpy as np
 
 from settings import GameSettings
 from constants import *  # Must include manhattan_distance, and color constants
 
 from .player import Player
-from .asteroid import Asteroid, ASTEROID_TYPES
+from .capabilities import Capabilities
+from .asteroid import AsteroidField, LensStats, ASTEROID_TYPES, ASTEROID_TYPE_NAMES, NO_OWNER
 from .robot import Robot
+from .actions import AvailableActions, ROBOT_PLANT_COST, DEBRIS_TORPEDO_COST
+from .board import BoardView, StringTable
+from .events import (EventBus, GameEvent, PLAYER_MOVED, RESOURCE_CHANGED, ROBOT_CHANGED, DEBRIS_ADDED,
+                     DISCOVERY_CHANGED, MODULES_CHANGED, TURN_ADVANCED)
+from .grid import GridLayers, GridSet, mask_to_cells
+from .log import GameLog, LogRecord, MESSAGE, MOVE, ROBOT_MINING, ROBOT_INCOME
 
 
 class Game:
-    def __init__(self, settings: GameSettings):
+    def __init__(self, settings: GameSettings, seed=None):
         self.settings = settings
+        # Every stochastic decision of this game draws from this stream (None seeds from OS entropy).
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.grid_width = settings.grid_width
         self.grid_height = settings.grid_height
         self.players = []
         self.asteroids = []
-        self.discovered_tiles = set()
-        self.debris = set()  # cells where debris is deployed (impassable)
+        # Dense per-tile layers; discovered_tiles and debris are set-style views over them.
+        self.layers = GridLayers(self.grid_width, self.grid_height)
+        self.discovered_tiles = GridSet(self.layers.discovered)
+        self.debris = GridSet(self.layers.debris)  # cells where debris is deployed (impassable)
+        # Spatial indexes, kept in sync on spawn, move, planting and hijacking.
+        self.asteroid_index = {}  # (x, y) -> Asteroid
+        self.player_index = {}  # (x, y) -> list of players on that tile
+        self.robot_index = {}  # player -> list of asteroids carrying a robot owned by that player
+        self.discovery_stamps = {}  # player -> (x, y, discovery_range) of the last discovery stamp
+        # Monotonically increasing counter, bumped on every state change; derived data is cached per version.
+        self.state_version = 0
+        self.reachability_cache = {}  # (start, range, warp_available) -> frozenset of cells
+        self.reachability_cache_version = 0
+        self.warp_targets_cache = (0, None)  # (state_version, frozenset of warp targets)
+        self.player_proximity_cache = (0, None, None)  # (state_version, radius, boolean layer)
+        self.lens_stats_cache = (0, None)  # (state_version, LensStats)
+        self.available_actions_cache = (0, None)  # (state_version, AvailableActions)
+        self.board_strings = StringTable()  # tile texts and colors of every BoardView of this game
+        self.game_log = GameLog()  # most recent LogRecords, filled by GameEngine
+        self.events = EventBus()  # GameEvents published on every state change
         self.turn = 1
         self.current_player_index = 0
         self.initialize_players(settings.num_players)
@@ -30,68 +56,210 @@ class Game:
 
     def initialize_players(self, num_players):
         for i in range(num_players):
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            self.players.append(Player(f"Player {i + 1}", x, y, self.settings))
+            x = self.rng.randint(0, self.grid_width - 1)
+            y = self.rng.randint(0, self.grid_height - 1)
+            player = Player(f"Player {i + 1}", x, y, self.settings, number=i + 1)
+            self.players.append(player)
+            self.player_index.setdefault((x, y), []).append(player)
+            self.layers.players[x, y] += 1
+            self.robot_index[player] = []
 
     def initialize_asteroids(self):
-        positions_used = set()
         asteroid_id = 1
-        num_to_spawn = random.randint(self.settings.min_asteroids, self.settings.max_asteroids)
+        num_to_spawn = self.rng.randint(self.settings.min_asteroids, self.settings.max_asteroids)
+        # Asteroid state lives in columns; self.asteroids holds the Asteroid views onto its rows.
+        self.asteroid_field = AsteroidField(self.players, capacity=num_to_spawn)
         while len(self.asteroids) < num_to_spawn:
-            x = random.randint(0, self.grid_width - 1)
-            y = random.randint(0, self.grid_height - 1)
-            if (x, y) in positions_used:
+            x = self.rng.randint(0, self.grid_width - 1)
+            y = self.rng.randint(0, self.grid_height - 1)
+            if (x, y) in self.asteroid_index:
                 continue
-            positions_used.add((x, y))
-            asteroid_type = random.choice(list(ASTEROID_TYPES.keys()))
+            asteroid_type = self.rng.choice(list(ASTEROID_TYPES.keys()))
             type_props = ASTEROID_TYPES[asteroid_type]
-            resource = random.randint(*type_props["resource_range"])
-            value = random.uniform(*type_props["value_range"])
-            color = type_props["color"]
-            event_override = type_props["event_probability_override"]
-            self.asteroids.append(
-                Asteroid(asteroid_id, x, y, resource, value, asteroid_type, color, event_override)
-            )
+            resource = self.rng.randint(*type_props["resource_range"])
+            value = self.rng.uniform(*type_props["value_range"])
+            asteroid = self.asteroid_field.add(asteroid_id, x, y, resource, value, asteroid_type)
+            self.asteroids.append(asteroid)
+            self.asteroid_index[(x, y)] = asteroid
+            self.layers.asteroids[x, y] = True
             asteroid_id += 1
+        self.initialize_totals()
+
+    def initialize_totals(self):
+        """
+        Sets up the running aggregates over the asteroids still holding resources:
+        active_asteroid_count, remaining_resource and remaining_value, and per asteroid type
+        (arrays indexed by type id) type_active_counts, type_remaining_resource and type_remaining_value.
+        record_extraction() keeps them up to date, so game-over checks and stats never rescan the field.
+        """
+        field = self.asteroid_field
+        type_ids = field.column("type_id")
+        resources = field.column("resource")
+        values = resources * field.column("value")
+        num_types = len(ASTEROID_TYPE_NAMES)
+        self.type_active_counts = np.bincount(type_ids[resources > 0], minlength=num_types)
+        self.type_remaining_resource = np.bincount(type_ids, weights=resources, minlength=num_types)
+        self.type_remaining_value = np.bincount(type_ids, weights=values, minlength=num_types)
+        self.active_asteroid_count = int(self.type_active_counts.sum())
+        self.remaining_resource = float(self.type_remaining_resource.sum())
+        self.remaining_value = float(self.type_remaining_value.sum())
+
+    def record_extraction(self, type_ids, amounts, gains, exhausted):
+        """
+        Updates the running aggregates after extraction from one or more asteroids.
+        Arguments are aligned sequences (one entry per mined asteroid): its type id, the amount
+        extracted, the value removed and whether the asteroid is now exhausted.
+        """
+        num_types = len(ASTEROID_TYPE_NAMES)
+        resource_by_type = np.bincount(type_ids, weights=amounts, minlength=num_types)
+        value_by_type = np.bincount(type_ids, weights=gains, minlength=num_types)
+        exhausted_by_type = np.bincount(type_ids, weights=exhausted, minlength=num_types).astype(np.int64)
+        self.type_remaining_resource -= resource_by_type
+        self.type_remaining_value -= value_by_type
+        self.type_active_counts -= exhausted_by_type
+        self.remaining_resource -= float(resource_by_type.sum())
+        self.remaining_value -= float(value_by_type.sum())
+        self.active_asteroid_count -= int(exhausted_by_type.sum())
+        # Repeated float subtraction leaves a tiny residue; once nothing is left the totals are exactly 0.
+        empty = self.type_active_counts == 0
+        self.type_remaining_resource[empty] = 0.0
+        self.type_remaining_value[empty] = 0.0
+        if self.active_asteroid_count == 0:
+            self.remaining_resource = 0.0
+            self.remaining_value = 0.0
+
+    def get_type_totals(self):
+        """Returns {asteroid type: (active asteroids, remaining resource, remaining value)}."""
+        return {name: (int(self.type_active_counts[i]), float(self.type_remaining_resource[i]),
+                       float(self.type_remaining_value[i]))
+                for i, name in enumerate(ASTEROID_TYPE_NAMES)}
+
+    # -------------------------
+    # Spatial index helpers
+    # -------------------------
+    def get_asteroid_at(self, x, y):
+        """Returns the asteroid on tile (x, y) (exhausted or not), or None."""
+        return self.asteroid_index.get((x, y))
+
+    def get_active_asteroid_at(self, x, y):
+        """Returns the non-exhausted asteroid on tile (x, y), or None."""
+        asteroid = self.asteroid_index.get((x, y))
+        if asteroid is None or asteroid.is_exhausted():
+            return None
+        return asteroid
+
+    def get_players_at(self, x, y):
+        """Returns the players standing on tile (x, y), in seat order. Do not mutate the result."""
+        return self.player_index.get((x, y), [])
+
+    def get_robot_asteroids(self, player):
+        """Returns the asteroids carrying a robot owned by player."""
+        return self.robot_index.get(player, [])
+
+    def bump_version(self):
+        """Marks the game state as changed, invalidating everything cached for the previous version."""
+        self.state_version += 1
+
+    def modules_changed(self, player):
+        """Must be called after a player's modules are bought, removed or upgraded outside of Game."""
+        player.invalidate_capabilities()
+        self.bump_version()
+        self.events.publish(GameEvent(MODULES_CHANGED, player=player))
+
+    def place_player(self, player, dest):
+        old_pos = (player.x, player.y)
+        occupants = self.player_index.get(old_pos)
+        if occupants is not None and player in occupants:
+            occupants.remove(player)
+            if not occupants:
+                del self.player_index[old_pos]
+            self.layers.players[old_pos] -= 1
+        player.x, player.y = dest
+        # Keep each tile's players in seat order: tile labels and tile info list them that way.
+        occupants = self.player_index.setdefault(dest, [])
+        seat = self.players.index(player)
+        position = 0
+        while position < len(occupants) and self.players.index(occupants[position]) < seat:
+            position += 1
+        occupants.insert(position, player)
+        self.layers.players[dest] += 1
+        self.bump_version()
+        self.events.publish(GameEvent(PLAYER_MOVED, (old_pos, dest), player))
+
+    def register_robot(self, asteroid, previous_owner=None, action="planted"):
+        """
+        Records the robot on asteroid under its current owner (called after planting or hijacking)
+        and publishes a ROBOT_CHANGED event with the given action.
+        """
+        if previous_owner is not None:
+            owned = self.robot_index.get(previous_owner)
+            if owned is not None and asteroid in owned:
+                owned.remove(asteroid)
+        if asteroid.robot is not None:
+            owned = self.robot_index.setdefault(asteroid.robot.owner, [])
+            if asteroid not in owned:
+                owned.append(asteroid)
+        self.bump_version()
+        self.events.publish(GameEvent(ROBOT_CHANGED, [(asteroid.x, asteroid.y)],
+                                      asteroid.robot.owner if asteroid.robot is not None else None,
+                                      action=action, previous_owner=previous_owner))
+
+    def stamp_discovery(self, cx, cy, radius):
+        """
+        Marks every tile within Manhattan distance radius of (cx, cy) as discovered.
+        Changes the state (and publishes DISCOVERY_CHANGED) only for tiles not discovered before.
+        """
+        xs, ys, mask = self.layers.diamond_mask(cx, cy, radius)
+        new = mask & ~self.layers.discovered[xs, ys]
+        if not new.any():
+            return
+        self.layers.discovered[xs, ys] |= new
+        self.bump_version()
+        cells = [(x + xs.start, y + ys.start) for x, y in np.argwhere(new).tolist()]
+        self.events.publish(GameEvent(DISCOVERY_CHANGED, cells))
 
     def update_discovered(self):
+        """
+        Stamps the discovery diamond of every player with a Telescope.
+        Only players whose position or discovery range changed since their last stamp are processed.
+        """
         for p in self.players:
-            telescope = p.get_module("Telescope")
-            if telescope is None:
+            discovery_range = p.capabilities.discovery_range
+            if discovery_range is None:
+                continue
+            stamp = (p.x, p.y, discovery_range)
+            if self.discovery_stamps.get(p) == stamp:
                 continue
-            for x in range(self.grid_width):
-                for y in range(self.grid_height):
-                    if manhattan_distance(p.x, p.y, x, y) <= telescope.discovery_range:
-                        self.discovered_tiles.add((x, y))
+            self.stamp_discovery(*stamp)
+            self.discovery_stamps[p] = stamp
 
     def get_reachable_cells(self, start, player):
         """
         Returns a set of reachable (x,y) cells.
         The parameter 'player' may be a player object (from which movement range, modules, etc. are used)
         or an int (for a fixed range).
+        Results are memoized per (start, range, warp availability) for the current state_version.
         """
+        warp_available = False
         if not isinstance(player, int):
-            warp = player.get_module("WarpDrive")
-            allowed_warp = set()
-            if warp is not None and not warp.used_this_turn:
-                allowed_warp = {(x, y) for x in range(self.grid_width) for y in range(self.grid_height)
-                                if (x, y) in self.discovered_tiles
-                                and (x, y) not in self.debris
-                                and not any(a for a in self.asteroids if a.x == x and a.y == y)}
-            reactor = player.get_module("Reactor")
-            if reactor is None and warp is None:
+            capabilities = player.capabilities
+            if not capabilities.can_move:
                 return False, "No Reactor available nor warp. Cannot move."
-            fusion = player.get_module("FusionReactor")
-            if reactor is not None:
-                base_range = reactor.movement_range
-            else:
-                base_range = 0
-            if fusion is not None:
-                base_range = int(base_range * fusion.movement_multiplier)
+            warp = player.get_module("WarpDrive")
+            warp_available = warp is not None and not warp.used_this_turn
+            base_range = capabilities.movement_range
         else:
             base_range = player
 
+        if self.reachability_cache_version != self.state_version:
+            self.reachability_cache.clear()
+            self.reachability_cache_version = self.state_version
+        key = (start, base_range, warp_available)
+        cached = self.reachability_cache.get(key)
+        if cached is not None:
+            return cached
+
+        passable = self.layers.passable_mask()
         reachable = {}
         queue = deque()
         queue.append((start, 0))
@@ -103,17 +271,29 @@ class Game:
             for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 nx, ny = x + dx, y + dy
                 if 0 <= nx < self.grid_width and 0 <= ny < self.grid_height:
-                    if (nx, ny) not in self.discovered_tiles:
-                        continue
-                    if (nx, ny) in self.debris:
+                    if not passable[nx, ny]:
                         continue
                     if (nx, ny) not in reachable or reachable[(nx, ny)] > dist + 1:
                         reachable[(nx, ny)] = dist + 1
                         queue.append(((nx, ny), dist + 1))
-        if not isinstance(player, int):
-            reachable = set(reachable.keys()) | set(allowed_warp)
+        reachable = set(reachable.keys())
+        if warp_available:
+            reachable |= self.get_warp_targets()
+        reachable = frozenset(reachable)
+        self.reachability_cache[key] = reachable
         return reachable
 
+    def get_warp_targets(self):
+        """
+        Returns the frozenset of tiles a WarpDrive can jump to (discovered, no debris, no asteroid).
+        Built from a single layer mask once per state_version and shared by all callers.
+        """
+        version, targets = self.warp_targets_cache
+        if version != self.state_version or targets is None:
+            targets = frozenset(mask_to_cells(self.layers.warp_mask()))
+            self.warp_targets_cache = (self.state_version, targets)
+        return targets
+
     def find_path(self, start, end, allowed_moves):
         queue = deque()
         queue.append(start)
@@ -138,96 +318,98 @@ class Game:
         return path
 
     def move_player(self, player, dest):
-        warp = player.get_module("WarpDrive")
-        allowed_warp = set()
-        if warp is not None and not warp.used_this_turn:
-            allowed_warp = {(x, y) for x in range(self.grid_width) for y in range(self.grid_height)
-                            if (x, y) in self.discovered_tiles
-                            and (x, y) not in self.debris
-                            and not any(a for a in self.asteroids if a.x == x and a.y == y)}
-        reactor = player.get_module("Reactor")
-        if reactor is None and warp is None:
+        capabilities = player.capabilities
+        if not capabilities.can_move:
             return False, "No Reactor available. Cannot move."
-        fusion = player.get_module("FusionReactor")
-        base_range = reactor.movement_range
-        if fusion is not None:
-            base_range = int(base_range * fusion.movement_multiplier)
+        # Includes the shared warp targets when the WarpDrive is still available this turn.
         allowed = self.get_reachable_cells((player.x, player.y), player)
         if dest not in allowed:
             return False, "Destination not reachable."
         path = self.find_path((player.x, player.y), dest, allowed)
-        if not path and warp is None:
+        if not path and capabilities.warp_level == 0:
             return False, "No valid path found."
-        telescope = player.get_module("Telescope")
-        if telescope is not None:
+        discovery_range = capabilities.discovery_range
+        if discovery_range is not None:
             for (px, py) in path:
-                for i in range(max(0, px - telescope.discovery_range), min(self.grid_width, px + telescope.discovery_range + 1)):
-                    for j in range(max(0, py - telescope.discovery_range), min(self.grid_height, py + telescope.discovery_range + 1)):
-                        if manhattan_distance(px, py, i, j) <= telescope.discovery_range:
-                            self.discovered_tiles.add((i, j))
+                self.stamp_discovery(px, py, discovery_range)
         old_pos = (player.x, player.y)
-        player.x, player.y = dest
-        message = f"{player.symbol} moves from {old_pos} to {dest} via path {path}."
-        asteroid = next((a for a in self.asteroids if (a.x, a.y) == dest), None)
+        self.place_player(player, dest)
+        if discovery_range is not None and path:
+            # The sweep above already covered the destination.
+            self.discovery_stamps[player] = (dest[0], dest[1], discovery_range)
+        suffix = ""
+        if capabilities.warp_level == 2:
+            suffix = " (Instant Warp: turn not consumed)"
+        message = LogRecord(MOVE, "{player} moves from {start} to {dest} via path {path}.{suffix}", self.turn,
+                            player=player.symbol, start=old_pos, dest=dest, path=path, suffix=suffix)
+        asteroid = self.get_asteroid_at(*dest)
         event = None
         if asteroid and not asteroid.visited:
             asteroid.visited = True
             chance = asteroid.event_probability
             if chance > 1:
                 chance = 1
-            if random.random() < chance:
-                event = asteroid.discovery(player)
-        if warp is not None and warp.level == 2:
-            message += " (Instant Warp: turn not consumed)"
+            if self.rng.random() < chance:
+                capabilities_before = player.capabilities
+                robot_before = asteroid.robot
+                event = asteroid.discovery(player, self.rng)
+                # The event may have boosted a module, paid a bonus or planted a free robot on this asteroid;
+                # announce only what it actually changed.
+                if Capabilities(player) != capabilities_before:
+                    self.modules_changed(player)
+                if asteroid.robot is not robot_before:
+                    self.register_robot(asteroid)
         return True, (message, event, path, asteroid)
 
     def get_remote_plant_targets(self, player):
-        launch_bay = player.get_module("LaunchBay")
+        capabilities = player.capabilities
         factory = player.get_module("Factory")
-        if launch_bay is None or factory is None or factory.robots_produced_this_turn >= factory.robot_production:
+        if capabilities.robot_range is None or factory is None or factory.robots_produced_this_turn >= capabilities.robot_production:
             return set()
-        reachable = self.get_reachable_cells((player.x, player.y), launch_bay.robot_range)
-        targets = {(a.x, a.y) for a in self.asteroids
-                   if (a.x, a.y) in reachable and (a.x, a.y) in self.discovered_tiles
-                   and not a.is_exhausted() and a.robot is None}
+        reachable = self.get_reachable_cells((player.x, player.y), capabilities.robot_range)
+        targets = set()
+        for cell in reachable:
+            asteroid = self.get_active_asteroid_at(*cell)
+            if asteroid is not None and asteroid.robot is None and cell in self.discovered_tiles:
+                targets.add(cell)
         return targets
 
+    def get_debris_radius(self):
+        """Debris radius of the current player's torpedoes (1, plus the ExplosivesLab bonus)."""
+        return self.players[self.current_player_index].capabilities.debris_radius
+
+    def get_player_proximity(self, radius):
+        """
+        Boolean layer of tiles within Manhattan distance radius of any player.
+        Cached per (state_version, radius).
+        """
+        version, cached_radius, mask = self.player_proximity_cache
+        if version != self.state_version or cached_radius != radius or mask is None:
+            mask = self.layers.proximity_mask(radius)
+            self.player_proximity_cache = (self.state_version, radius, mask)
+        return mask
+
     def can_deploy_debris(self, cell):
         cx, cy = cell
-        current = self.players[self.current_player_index]
-        explosives = current.get_module("ExplosivesLab")
-        radius = 1  # default
-        if explosives is not None:
-            radius += explosives.debris_radius
+        if not (0 <= cx < self.grid_width and 0 <= cy < self.grid_height):
+            return False, "Debris target outside the map."
+        radius = self.get_debris_radius()
+        # The region grown by one tile in each direction is the diamond of radius + 1,
+        # so the target is invalid if any player stands within radius + 1 of it.
+        if self.get_player_proximity(radius + 1)[cx, cy]:
+            return False, "Debris region too close to a player."
         debris_region = {(cx + dx, cy + dy) for dx in range(-radius, radius + 1) for dy in range(-radius, radius + 1)
                          if abs(dx) + abs(dy) <= radius}
-        forbidden = set()
-        for (x, y) in debris_region:
-            forbidden.update({(x, y), (x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)})
-        for (x, y) in forbidden:
-            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
-                for p in self.players:
-                    if (p.x, p.y) == (x, y):
-                        return False, "Debris region too close to a player."
         return True, debris_region
 
     def get_debris_targets(self, player):
-        launch_bay = player.get_module("LaunchBay")
-        if launch_bay is None:
+        debris_range = player.capabilities.debris_range
+        if debris_range is None:
             return set()
-        explosives = player.get_module("ExplosivesLab")
-        if explosives is not None:
-            reachable = self.get_reachable_cells((player.x, player.y), launch_bay.robot_range + 3 + explosives.extra_range)
-        else:
-            reachable = self.get_reachable_cells((player.x, player.y), launch_bay.robot_range + 3)
-        targets = set()
-        for cell in reachable:
-            if any(a for a in self.asteroids if (a.x, a.y) == cell):
-                continue
-            valid, region = self.can_deploy_debris(cell)
-            if valid:
-                targets.add(cell)
-        return targets
+        reachable = self.get_reachable_cells((player.x, player.y), debris_range)
+        too_close = self.get_player_proximity(self.get_debris_radius() + 1)
+        asteroids = self.layers.asteroids
+        return {cell for cell in reachable if not asteroids[cell] and not too_close[cell]}
 
     def deploy_debris(self, player, cell):
         """
@@ -237,54 +419,96 @@ class Game:
         valid, region_or_message = self.can_deploy_debris(cell)
         if not valid:
             return False, "Selected tile fails debris deployment validation."
-        if player.money < 200:
+        if player.money < DEBRIS_TORPEDO_COST:
             return False, "Not enough money for debris torpedo."
-        player.money -= 200
+        player.money -= DEBRIS_TORPEDO_COST
         region = region_or_message
-        for tile in region:
-            if any(a for a in self.asteroids if a.x == tile[0] and a.y == tile[1]):
-                continue
-            self.debris.add(tile)
-        return True, f"{player.symbol} deploys debris torpedo at {cell}. Debris covers {region} (asteroid tiles skipped)."
+        xs, ys, mask = self.layers.diamond_mask(cell[0], cell[1], self.get_debris_radius())
+        added = mask & ~self.layers.asteroids[xs, ys]
+        self.layers.debris[xs, ys] |= added
+        self.bump_version()
+        cells = [(x + xs.start, y + ys.start) for x, y in np.argwhere(added).tolist()]
+        self.events.publish(GameEvent(DEBRIS_ADDED, cells, player))
+        return True, LogRecord(MESSAGE, "{player} deploys debris torpedo at {cell}. Debris covers {region} (asteroid tiles skipped).",
+                               self.turn, player=player.symbol, cell=cell, region=region)
 
     def manual_mine(self, player, asteroid):
-        drill = player.get_module("Drill")
-        if drill is None:
+        capacity = player.capabilities.mining_capacity_for(asteroid)
+        if capacity is None:
             return "No Drill available. Cannot mine."
         if asteroid.is_exhausted():
             return f"Asteroid {asteroid.id} is exhausted."
-        capacity = drill.mining_capacity
-        if asteroid.asteroid_type.lower() == "ice":
-            ip = player.get_module("IcePenetrator")
-            if ip is not None:
-                capacity *= ip.multiplier
         if asteroid.resource >= capacity:
             extraction = capacity
             asteroid.resource -= extraction
             gain = extraction * asteroid.value
             player.money += gain
             player.total_mined += extraction
+            player.total_earned_by_mining += gain
+            self.record_extraction([asteroid.field.type_id[asteroid.index]], [extraction], [gain],
+                                   [asteroid.is_exhausted()])
+            self.bump_version()
+            self.events.publish(GameEvent(RESOURCE_CHANGED, [(asteroid.x, asteroid.y)], player))
             return f"{player.symbol} manually mines {extraction} from A{asteroid.id} and receives ${gain:.1f}."
         else:
             extraction = asteroid.resource
             gain = extraction * asteroid.value
             player.money += gain
             player.total_mined += extraction
+            player.total_earned_by_mining += gain
             asteroid.resource = 0
+            self.record_extraction([asteroid.field.type_id[asteroid.index]], [extraction], [gain], [True])
+            self.bump_version()
+            self.events.publish(GameEvent(RESOURCE_CHANGED, [(asteroid.x, asteroid.y)], player))
             return f"{player.symbol} manually mines {extraction} from A{asteroid.id} (all) and receives ${gain:.1f}."
 
-    def robot_mining(self, log_func):
+    def robot_mining(self, log_func, robot_details=False):
+        """
+        Lets every robot mine its asteroid and pays the owners.
+        log_func receives one ROBOT_INCOME summary per owner, preceded with robot_details=True
+        by one ROBOT_MINING LogRecord per robot.
+        """
         for p in self.players:
             p.money_earned_by_robots = 0
-        for a in self.asteroids:
-            if a.robot and not a.is_exhausted():
-                extraction = min(a.robot.capacity, a.resource)
-                gain = extraction * a.value
-                a.resource -= extraction
-                a.robot.owner.money += gain
-                a.robot.owner.money_earned_by_robots += gain
-                a.robot.owner.total_mined += extraction
-                log_func(f"Robot on A{a.id} (owned by {a.robot.owner.symbol}, Cap: {a.robot.capacity}) extracts {extraction} and earns ${gain:.1f}.")
+        field = self.asteroid_field
+        owners = field.column("robot_owner")
+        resources = field.column("resource")
+        # Every robot on a non-exhausted asteroid extracts up to its capacity in one vectorized step.
+        working = np.flatnonzero((owners != NO_OWNER) & (resources > 0))
+        if len(working):
+            extraction = np.minimum(field.robot_capacity[working], resources[working])
+            gain = extraction * field.value[working]
+            resources[working] -= extraction
+            self.record_extraction(field.type_id[working], extraction, gain, resources[working] <= 0)
+            owner_ids = owners[working]
+            payout = np.bincount(owner_ids, weights=gain, minlength=len(self.players))
+            mined = np.bincount(owner_ids, weights=extraction, minlength=len(self.players))
+            for p, earned, amount in zip(self.players, payout.tolist(), mined.tolist()):
+                if amount == 0:
+                    continue
+                p.money += earned
+                p.money_earned_by_robots += earned
+                p.total_earned_by_robots += earned
+                p.total_mined += amount
+            if robot_details:
+                for i, owner_id, cap, amount, earned in zip(working.tolist(), owner_ids.tolist(),
+                                                            field.robot_capacity[working].tolist(),
+                                                            extraction.tolist(), gain.tolist()):
+                    log_func(LogRecord(ROBOT_MINING,
+                                       "Robot on A{asteroid} (owned by {owner}, Cap: {cap}) extracts {amount:g} and earns ${earned:.1f}.",
+                                       self.turn, asteroid=self.asteroids[i].id, owner=self.players[owner_id].symbol,
+                                       cap=cap, amount=amount, earned=earned))
+            for p, earned, amount, robots in zip(self.players, payout.tolist(), mined.tolist(),
+                                                 np.bincount(owner_ids, minlength=len(self.players)).tolist()):
+                if robots:
+                    log_func(LogRecord(ROBOT_INCOME,
+                                       "{player}'s {robots} robot(s) extract {amount:g} and earn ${earned:.1f}.",
+                                       self.turn, player=p.symbol, robots=robots, amount=amount, earned=earned))
+            self.bump_version()
+            cells = list(zip(field.x[working].tolist(), field.y[working].tolist()))
+            self.events.publish(GameEvent(RESOURCE_CHANGED, cells))
+        else:
+            self.bump_version()
 
     def remote_plant_robot(self, player, target):
         if target is None:
@@ -293,105 +517,83 @@ class Game:
             return ("Asteroid is undiscovered.", False)
         if target.is_exhausted():
             return ("Asteroid is exhausted.", False)
-        if player.money < 100:
+        if player.money < ROBOT_PLANT_COST:
             return ("Not enough money to plant robot remotely.", False)
         if target.robot is not None:
             return ("A robot already exists on this asteroid.", False)
-        launch_bay = player.get_module("LaunchBay")
-        if launch_bay is None:
+        capabilities = player.capabilities
+        if capabilities.robot_range is None:
             return ("No LaunchBay available. Cannot plant robot remotely.", False)
-        player.money -= 100
-        factory = player.get_module("Factory")
-        if factory is None:
+        player.money -= ROBOT_PLANT_COST
+        if capabilities.robot_capacity is None:
             return ("No Factory available. Cannot determine robot capacity.", False)
-        target.robot = Robot(player, factory.robot_capacity)
-        return (f"{player.symbol} plants a robot on A{target.id} with capacity {factory.robot_capacity}.", False)
+        target.robot = Robot(player, capabilities.robot_capacity)
+        self.register_robot(target)
+        return (f"{player.symbol} plants a robot on A{target.id} with capacity {capabilities.robot_capacity}.", False)
 
     def hijack_robot(self, player):
-        asteroid = next((a for a in self.asteroids if a.x == player.x and a.y == player.y and not a.is_exhausted()), None)
+        asteroid = self.get_active_asteroid_at(player.x, player.y)
         if asteroid is None:
             return ("No asteroid here for hijacking.", False)
         if asteroid.robot is None:
             return ("No robot on this asteroid to hijack.", False)
         if asteroid.robot.owner == player:
             return ("You already own the robot here.", False)
-        factory = player.get_module("Factory")
-        if factory is None:
+        robot_capacity = player.capabilities.robot_capacity
+        if robot_capacity is None:
             return ("No Factory available. Cannot hijack robot.", False)
+        previous_owner = asteroid.robot.owner
         asteroid.robot.owner = player
-        asteroid.robot.capacity = factory.robot_capacity
+        asteroid.robot.capacity = robot_capacity
+        self.register_robot(asteroid, previous_owner, action="hijacked")
         return (f"{player.symbol} hijacks the robot on A{asteroid.id} and now controls it.", True)
 
     def upgrade_all_robots(self, player):
-        launch_bay = player.get_module("LaunchBay")
-        factory = player.get_module("Factory")
-        if launch_bay is None or factory is None:
+        capabilities = player.capabilities
+        robot_range, robot_capacity = capabilities.robot_range, capabilities.robot_capacity
+        if robot_range is None or robot_capacity is None:
             return ["Required modules missing to upgrade robots."]
-        upgraded_any = False
+        upgraded = []
         messages = []
-        for a in self.asteroids:
+        for a in self.get_robot_asteroids(player):
             if a.robot and a.robot.owner == player:
-                if manhattan_distance(player.x, player.y, a.x, a.y) <= launch_bay.robot_range:
-                    if a.robot.capacity < factory.robot_capacity:
+                if manhattan_distance(player.x, player.y, a.x, a.y) <= robot_range:
+                    if a.robot.capacity < robot_capacity:
                         old_cap = a.robot.capacity
-                        a.robot.capacity = factory.robot_capacity
-                        messages.append(f"{player.symbol} upgrades robot on A{a.id} from capacity {old_cap} to {factory.robot_capacity}.")
-                        upgraded_any = True
-        if upgraded_any:
+                        a.robot.capacity = robot_capacity
+                        messages.append(f"{player.symbol} upgrades robot on A{a.id} from capacity {old_cap} to {robot_capacity}.")
+                        upgraded.append((a.x, a.y))
+        if upgraded:
+            self.bump_version()
+            self.events.publish(GameEvent(ROBOT_CHANGED, upgraded, player, action="upgraded"))
             messages.append("All eligible robots have been upgraded.")
         else:
             messages.append("No eligible robots found to upgrade.")
         return messages
 
     def upgrade_player(self, player, upgrade_type, log_func):
-        if upgrade_type == "mining":
-            drill = player.get_module("Drill")
-            if drill is None:
-                log_func("No Drill available to upgrade.")
-                return
-            success, message = drill.upgrade(player)
-            if success:
-                player.upgrades_purchased += 1
-            log_func(message)
-        elif upgrade_type == "discovery":
-            telescope = player.get_module("Telescope")
-            if telescope is None:
-                log_func("No Telescope available to upgrade.")
-                return
-            success, message = telescope.upgrade(player)
-            if success:
-                player.upgrades_purchased += 1
-            log_func(message)
-        elif upgrade_type == "movement":
-            reactor = player.get_module("Reactor")
-            if reactor is None:
-                log_func("No Reactor available to upgrade.")
-                return
-            success, message = reactor.upgrade(player)
-            if success:
-                player.upgrades_purchased += 1
-            log_func(message)
-        elif upgrade_type == "robot_range":
-            launch_bay = player.get_module("LaunchBay")
-            if launch_bay is None:
-                log_func("No LaunchBay available to upgrade.")
-                return
-            success, message = launch_bay.upgrade(player)
-            if success:
-                player.upgrades_purchased += 1
-            log_func(message)
-        elif upgrade_type == "robot_capacity":
-            factory = player.get_module("Factory")
-            if factory is None:
-                log_func("No Factory available to upgrade.")
-                return
-            success, message = factory.upgrade(player)
-            if success:
-                player.upgrades_purchased += 1
-            log_func(message)
+        module_name = {
+            "mining": "Drill",
+            "discovery": "Telescope",
+            "movement": "Reactor",
+            "robot_range": "LaunchBay",
+            "robot_capacity": "Factory",
+        }.get(upgrade_type)
+        if module_name is None:
+            return
+        module = player.get_module(module_name)
+        if module is None:
+            log_func(f"No {module_name} available to upgrade.")
+            return
+        success, message = module.upgrade(player)
+        if success:
+            player.upgrades_purchased += 1
+            # Only after the upgrade, so subscribers reading capabilities see the new level.
+            self.modules_changed(player)
+        log_func(message)
 
     def is_game_over(self):
-        return all(a.is_exhausted() for a in self.asteroids)
+        return self.active_asteroid_count == 0
 
     def get_current_player(self):
         return self.players[self.current_player_index]
@@ -400,25 +602,58 @@ class Game:
         for player in self.players:
             player.next_turn()
 
+        previous = self.players[self.current_player_index]
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         if self.current_player_index == 0:
             self.turn += 1
+        self.bump_version()
+        current = self.players[self.current_player_index]
+        self.events.publish(GameEvent(TURN_ADVANCED, [(previous.x, previous.y), (current.x, current.y)], current))
 
     def get_allowed_moves(self, player):
         """
         Returns a tuple (allowed_moves, error). If no Reactor or WarpDrive exists, an error message is returned.
         """
-        warp = player.get_module("WarpDrive")
-        reactor = player.get_module("Reactor")
-        if reactor is None and warp is None:
+        if not player.capabilities.can_move:
             return set(), "No Reactor available and no Warp drive. Cannot move."
         allowed = self.get_reachable_cells((player.x, player.y), player)
         return set(allowed), None
 
-    def get_base_tile_properties(self, x, y, current_player, lens=None):
+    def get_available_actions(self, player=None):
+        """
+        Returns the AvailableActions of player (default: the current player), computed at most
+        once per state_version. Its target sets are shared; do not mutate them.
+        """
+        if player is None:
+            player = self.get_current_player()
+        version, actions = self.available_actions_cache
+        if version != self.state_version or actions is None or actions.player is not player:
+            actions = AvailableActions(self, player)
+            self.available_actions_cache = (self.state_version, actions)
+        return actions
+
+    def get_lens_stats(self):
+        """Returns the LensStats of the current state, computed at most once per state_version."""
+        version, stats = self.lens_stats_cache
+        if version != self.state_version or stats is None:
+            stats = LensStats(self.asteroid_field, self.layers.discovered)
+            self.lens_stats_cache = (self.state_version, stats)
+        return stats
+
+    def get_lens_range(self):
+        """
+        Returns (min_resource, max_resource, min_value, max_value) as logarithms over the
+        active (not exhausted) asteroids, used to normalise the "resource" and "value" lenses.
+        Undiscovered asteroids count as 100000 for the minimum and 0 for the maximum.
+        """
+        return self.get_lens_stats().ranges
+
+    def get_base_tile_properties(self, x, y, current_player, lens=None, lens_stats=None):
         """
         Returns a dictionary with keys 'text', 'bg', and 'fg' for a tile at (x,y) based solely on game state.
         UI-specific modifications (such as selection or highlighting) should be applied in the UI.
+        When redrawing many tiles with the "resource" or "value" lens, pass lens_stats=get_lens_stats()
+        (fetched once per frame).
         """
         if (x, y) in self.debris:
             return {"text": "D", "bg": DEBRIS_BG, "fg": "white"}
@@ -426,8 +661,8 @@ class Game:
             return {"text": "??", "bg": UNDISCOVERED_BG, "fg": DARK_FG}
 
         # Find any players or an asteroid at tile (x, y)
-        players_here = [p for p in self.players if (p.x, p.y) == (x, y)]
-        asteroid_here = next((a for a in self.asteroids if (a.x, a.y) == (x, y)), None)
+        players_here = self.get_players_at(x, y)
+        asteroid_here = self.get_asteroid_at(x, y)
 
         if players_here:
             if len(players_here) == 1:
@@ -441,19 +676,12 @@ class Game:
             bg = ACTIVE_PLAYER_TILE_COLOR if (x, y) == (current_player.x, current_player.y) else EMPTY_TILE_BG
 
         if asteroid_here:
-            # For the "resource" and "value" lenses we want to color the background using a colormap.
-            # Here we compute the min/max from all active (i.e. not exhausted) asteroids.
+            # For the "resource" and "value" lenses we want to color the background using a colormap,
+            # normalised over all active (i.e. not exhausted) asteroids.
             if lens in ("resource", "value"):
-                active_asteroids = [a for a in self.asteroids if not a.is_exhausted()]
-                if active_asteroids:
-                    min_resource = math.log(min(a.resource if (a.x, a.y) in self.discovered_tiles else 100000 for a in active_asteroids))
-                    max_resource = math.log(max(a.resource if (a.x, a.y) in self.discovered_tiles else 0 for a in active_asteroids))
-                    min_value = math.log(min(a.resource * a.value if (a.x, a.y) in self.discovered_tiles else 100000 for a in active_asteroids))
-                    max_value = math.log(max(a.resource * a.value if (a.x, a.y) in self.discovered_tiles else 0 for a in active_asteroids))
-                else:
-                    # Fall back to defaults if no active asteroids are found
-                    min_resource = max_resource = 0
-                    min_value = max_value = 0
+                if lens_stats is None:
+                    lens_stats = self.get_lens_stats()
+                min_resource, max_resource, min_value, max_value = lens_stats.ranges
 
             if lens == "resource":
                 num = asteroid_here.resource
@@ -462,7 +690,7 @@ class Game:
                     text = f"{short_num(num)}"
                 fg = asteroid_here.robot.owner.color if asteroid_here.robot else "white"
                 if not asteroid_here.is_exhausted():
-                    bg = value_to_bg(math.log(num), min_resource, max_resource, asteroid_here.color)
+                    bg = value_to_bg(lens_stats.log_resource[asteroid_here.index], min_resource, max_resource, asteroid_here.color)
                 else:
                     bg = ASTEROID_BG
 
@@ -472,7 +700,7 @@ class Game:
                     text = f"${short_num(num)}"
                 fg = asteroid_here.robot.owner.color if asteroid_here.robot else "white"
                 if not asteroid_here.is_exhausted():
-                    bg = value_to_bg(math.log(num), min_value, max_value, asteroid_here.color)
+                    bg = value_to_bg(lens_stats.log_value[asteroid_here.index], min_value, max_value, asteroid_here.color)
                 else:
                     bg = ASTEROID_BG
 
@@ -501,3 +729,48 @@ class Game:
         bg = ACTIVE_PLAYER_TILE_COLOR if (x, y) == (current_player.x, current_player.y) else bg
 
         return {"text": text, "bg": bg, "fg": fg}
+
+    def render_board(self, current_player, lens=None, cells=None, base=None):
+        """
+        Returns a BoardView of every tile, as get_base_tile_properties() would describe them.
+        Empty, undiscovered and debris tiles are filled with array operations; only tiles holding
+        an asteroid or a player go through get_base_tile_properties().
+        With cells and base (a BoardView rendered for the same lens), only those cells are
+        re-rendered on a copy of base; GameEvent.cells says which ones an action touched.
+        """
+        if cells is not None and base is not None:
+            return self.render_cells(current_player, lens, cells, base)
+        intern = self.board_strings.intern
+        layers = self.layers
+        shape = (self.grid_width, self.grid_height)
+        text = np.full(shape, intern("."), dtype=np.int32)
+        bg = np.full(shape, intern(EMPTY_TILE_BG), dtype=np.int32)
+        fg = np.full(shape, intern(DARK_FG), dtype=np.int32)
+        hidden = ~layers.discovered
+        text[hidden] = intern("??")
+        bg[hidden] = intern(UNDISCOVERED_BG)
+        debris = layers.debris
+        text[debris] = intern("D")
+        bg[debris] = intern(DEBRIS_BG)
+        fg[debris] = intern("white")
+        occupied = (layers.asteroids | (layers.players > 0)) & layers.discovered & ~debris
+        lens_stats = self.get_lens_stats() if lens in ("resource", "value") else None
+        for x, y in np.argwhere(occupied).tolist():
+            props = self.get_base_tile_properties(x, y, current_player, lens=lens, lens_stats=lens_stats)
+            text[x, y] = intern(props["text"])
+            bg[x, y] = intern(props["bg"])
+            fg[x, y] = intern(props["fg"])
+        return BoardView(text, bg, fg, self.board_strings)
+
+    def render_cells(self, current_player, lens, cells, base):
+        """Copy of the BoardView base with the given (x, y) cells re-rendered."""
+        intern = self.board_strings.intern
+        text, bg, fg = base.text.copy(), base.bg.copy(), base.fg.copy()
+        lens_stats = self.get_lens_stats() if lens in ("resource", "value") else None
+        for x, y in set(cells):
+            if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+                props = self.get_base_tile_properties(x, y, current_player, lens=lens, lens_stats=lens_stats)
+                text[x, y] = intern(props["text"])
+                bg[x, y] = intern(props["bg"])
+                fg[x, y] = intern(props["fg"])
+        return BoardView(text, bg, fg, self.board_strings)
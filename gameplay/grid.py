@@ -0,0 +1,109 @@
+# grid.py
+"""
+Dense per-tile state of the board.
+Each layer is a NumPy array of shape (grid_width, grid_height), indexed as layer[x, y],
+so whole-board queries (warp targets, player proximity, lens masks) are array operations.
+GridSet wraps a boolean layer with the set-of-(x, y) API the rest of the game uses.
+"""
+import numpy as np
+
+
+class GridSet:
+    """
+    Set-style view over a boolean grid layer.
+    Supports `in`, add, discard, update, iteration, len and truthiness.
+    Cells outside the grid are never members and are ignored when added.
+    """
+    def __init__(self, array):
+        self.array = array
+        self.width, self.height = array.shape
+
+    def _in_bounds(self, cell):
+        x, y = cell
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __contains__(self, cell):
+        return self._in_bounds(cell) and bool(self.array[cell[0], cell[1]])
+
+    def add(self, cell):
+        if self._in_bounds(cell):
+            self.array[cell[0], cell[1]] = True
+
+    def discard(self, cell):
+        if self._in_bounds(cell):
+            self.array[cell[0], cell[1]] = False
+
+    def update(self, cells):
+        for cell in cells:
+            self.add(cell)
+
+    def clear(self):
+        self.array[:] = False
+
+    def __iter__(self):
+        for x, y in np.argwhere(self.array).tolist():
+            yield (x, y)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.array))
+
+    def __bool__(self):
+        return bool(self.array.any())
+
+    def __repr__(self):
+        return f"GridSet({len(self)} cells)"
+
+
+class GridLayers:
+    """
+    Holds the board layers:
+      - discovered: tiles revealed by any telescope
+      - debris: impassable debris tiles
+      - asteroids: tiles occupied by an asteroid (exhausted or not)
+      - players: number of players standing on each tile
+    """
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.discovered = np.zeros((width, height), dtype=bool)
+        self.debris = np.zeros((width, height), dtype=bool)
+        self.asteroids = np.zeros((width, height), dtype=bool)
+        self.players = np.zeros((width, height), dtype=np.uint8)
+
+    def stamp_diamond(self, layer, cx, cy, radius):
+        """Sets every cell of layer within Manhattan distance radius of (cx, cy) to True."""
+        for i in range(max(0, cx - radius), min(self.width, cx + radius + 1)):
+            span = radius - abs(cx - i)
+            layer[i, max(0, cy - span):min(self.height, cy + span + 1)] = True
+
+    def diamond_mask(self, cx, cy, radius):
+        """
+        Returns (x_slice, y_slice, mask) where mask is the boolean diamond of the given radius
+        around (cx, cy), clipped to the board and aligned with layer[x_slice, y_slice].
+        """
+        x0, x1 = max(0, cx - radius), min(self.width, cx + radius + 1)
+        y0, y1 = max(0, cy - radius), min(self.height, cy + radius + 1)
+        xs = np.arange(x0, x1)[:, None]
+        ys = np.arange(y0, y1)[None, :]
+        mask = (np.abs(xs - cx) + np.abs(ys - cy)) <= radius
+        return slice(x0, x1), slice(y0, y1), mask
+
+    def proximity_mask(self, radius):
+        """Tiles within Manhattan distance radius of at least one player (the players layer dilated by radius)."""
+        mask = np.zeros((self.width, self.height), dtype=bool)
+        for x, y in np.argwhere(self.players).tolist():
+            self.stamp_diamond(mask, x, y, radius)
+        return mask
+
+    def warp_mask(self):
+        """Tiles a WarpDrive may jump to: discovered, free of debris and free of asteroids."""
+        return self.discovered & ~self.debris & ~self.asteroids
+
+    def passable_mask(self):
+        """Tiles that regular movement may enter: discovered and free of debris."""
+        return self.discovered & ~self.debris
+
+
+def mask_to_cells(mask):
+    """Converts a boolean layer into a set of (x, y) tuples."""
+    return {(x, y) for x, y in np.argwhere(mask).tolist()}
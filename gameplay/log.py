@@ -0,0 +1,69 @@
+# log.py
+"""
+Structured game log.
+Game and GameEngine emit LogRecords: a kind, a str.format template and its arguments.
+Records are only formatted when somebody reads them, and GameLog keeps the most recent
+ones in a fixed-size ring buffer, so verbose records (one per mining robot per turn)
+cost almost nothing unless displayed.
+"""
+from collections import deque
+
+# Record kinds
+MESSAGE = "message"  # plain text produced by a rule or action
+MOVE = "move"
+ROBOT_MINING = "robot_mining"  # one robot's extraction (detail; only with robot_details, hidden by the GUI)
+ROBOT_INCOME = "robot_income"  # one player's robot earnings for the turn (summary)
+END_OF_TURN = "end_of_turn"
+GAME_OVER = "game_over"
+
+# Kinds that are kept in the log but not shown line by line in the GUI.
+DETAIL_KINDS = frozenset({ROBOT_MINING})
+
+
+class LogRecord:
+    __slots__ = ("kind", "template", "args", "turn")
+
+    def __init__(self, kind, template, turn=None, **args):
+        self.kind = kind
+        self.template = template
+        self.args = args
+        self.turn = turn
+
+    @classmethod
+    def of(cls, message, turn=None):
+        """Wraps a record or a plain message string as a record."""
+        if isinstance(message, LogRecord):
+            return message
+        return cls(MESSAGE, "{text}", turn, text=message)
+
+    def format(self):
+        return self.template.format(**self.args)
+
+    __str__ = format
+
+    def __repr__(self):
+        return f"LogRecord({self.kind!r}, turn={self.turn}, args={self.args!r})"
+
+
+class GameLog:
+    """Ring buffer of the most recent maxlen LogRecords."""
+    def __init__(self, maxlen=1000):
+        self.records = deque(maxlen=maxlen)
+
+    def add(self, record):
+        self.records.append(record)
+        return record
+
+    def extend(self, records):
+        self.records.extend(records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def tail(self, n, kinds=None):
+        """Returns the last n records, optionally restricted to the given kinds."""
+        selected = [r for r in self.records if kinds is None or r.kind in kinds]
+        return selected[-n:]
@@ -244,3 +244,24 @@ class WarpDrive(Module):
 
     def next_turn(self):
         self.used_this_turn = False
+
+
+# Modules that can be bought, mapped to a constructor returning a fresh instance.
+# (These default values can be adjusted as needed.)
+MODULE_CATALOG = {
+    "Drill": lambda: Drill(mining_capacity=10, upgrade_cost=500, upgrade_increment=5, cost_increase=200),
+    "Reactor": lambda: Reactor(movement_range=5, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
+    "Telescope": lambda: Telescope(discovery_range=3, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
+    "Factory": lambda: Factory(robot_capacity=2, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
+    "LaunchBay": lambda: LaunchBay(robot_range=2, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
+    "IcePenetrator": lambda: IcePenetrator(),
+    "NERVA": lambda: FusionReactor(),
+    "ExplosivesLab": lambda: ExplosivesLab(),
+    "WarpDrive": lambda: WarpDrive(),
+}
+
+# Purchase price of every catalogue module, so prices can be shown without building modules.
+MODULE_BUILD_COSTS = {name: constructor().build_cost for name, constructor in MODULE_CATALOG.items()}
+
+# A ship has room for at most this many modules.
+MAX_MODULES = 8
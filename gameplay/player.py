@@ -1,55 +1,95 @@
 from settings import GameSettings
 from constants import *
 
+from .capabilities import Capabilities
 from .modules import Drill, Reactor, Telescope, Factory, LaunchBay
 
 class Player:
     next_id = 1
 
-    def __init__(self, name, x, y, settings: GameSettings):
+    def __init__(self, name, x, y, settings: GameSettings, number=None):
+        """number is the player's seat (1-based); without it a process-wide counter is used."""
         self.name = name
-        self.symbol = f"P{Player.next_id}"
-        self.color = PLAYER_COLORS[(Player.next_id - 1) % len(PLAYER_COLORS)]
-        Player.next_id += 1
+        if number is None:
+            number = Player.next_id
+            Player.next_id += 1
+        self.symbol = f"P{number}"
+        self.color = PLAYER_COLORS[(number - 1) % len(PLAYER_COLORS)]
         self.money = settings.initial_money
-        # Instead of separate attributes, store all modules in a list.
+        # Instead of separate attributes, store all modules in a list (in installation order).
+        # module_registry maps every name a module is looked up by to the module itself.
         self.modules = []
-        self.modules.append(Drill(settings.initial_mining_capacity,
-                                  settings.upgrade_mining_cost,
-                                  settings.mining_upgrade_amount,
-                                  settings.upgrade_mining_cost_increase))
-        self.modules.append(Telescope(settings.initial_discovery_range,
-                                      settings.upgrade_discovery_cost,
-                                      settings.discovery_upgrade_amount,
-                                      settings.upgrade_discovery_cost_increase))
-        self.modules.append(Reactor(settings.initial_movement_range,
-                                    settings.upgrade_movement_cost,
-                                    settings.movement_upgrade_amount,
-                                    settings.upgrade_movement_cost_increase))
-        self.modules.append(LaunchBay(settings.initial_robot_range,
-                                      settings.upgrade_robot_range_cost,
-                                      settings.robot_range_upgrade_amount,
-                                      settings.upgrade_robot_range_cost_increase))
-        self.modules.append(Factory(settings.initial_robot_capacity,
-                                    settings.upgrade_robot_capacity_cost,
-                                    settings.robot_capacity_upgrade_amount,
-                                    settings.upgrade_robot_capacity_cost_increase))
+        self.module_registry = {}
+        self._capabilities = None  # cached Capabilities snapshot, rebuilt after any module change
+        self.add_module(Drill(settings.initial_mining_capacity,
+                              settings.upgrade_mining_cost,
+                              settings.mining_upgrade_amount,
+                              settings.upgrade_mining_cost_increase))
+        self.add_module(Telescope(settings.initial_discovery_range,
+                                  settings.upgrade_discovery_cost,
+                                  settings.discovery_upgrade_amount,
+                                  settings.upgrade_discovery_cost_increase))
+        self.add_module(Reactor(settings.initial_movement_range,
+                                settings.upgrade_movement_cost,
+                                settings.movement_upgrade_amount,
+                                settings.upgrade_movement_cost_increase))
+        self.add_module(LaunchBay(settings.initial_robot_range,
+                                  settings.upgrade_robot_range_cost,
+                                  settings.robot_range_upgrade_amount,
+                                  settings.upgrade_robot_range_cost_increase))
+        self.add_module(Factory(settings.initial_robot_capacity,
+                                settings.upgrade_robot_capacity_cost,
+                                settings.robot_capacity_upgrade_amount,
+                                settings.upgrade_robot_capacity_cost_increase))
         self.upgrades_purchased = 0
         self.total_mined = 0
         self.x = x
         self.y = y
 
-        self.money_earned_by_robots = 0
+        self.money_earned_by_robots = 0  # robot income of the last end-of-turn mining round
+        self.total_earned_by_robots = 0
+        self.total_earned_by_mining = 0
+
+    @staticmethod
+    def module_keys(module):
+        """
+        Names a module is registered under: its display name and its class name
+        (a FusionReactor is displayed as "NERVA" but rules ask for it as "FusionReactor").
+        """
+        return {module.name, type(module).__name__}
+
+    def add_module(self, module):
+        self.modules.append(module)
+        for key in self.module_keys(module):
+            self.module_registry.setdefault(key, module)
+        self.invalidate_capabilities()
+
+    def remove_module(self, module):
+        self.modules.remove(module)
+        for key in self.module_keys(module):
+            if self.module_registry.get(key) is module:
+                del self.module_registry[key]
+                # Fall back to another installed module of the same kind, if any.
+                for other in self.modules:
+                    if key in self.module_keys(other):
+                        self.module_registry[key] = other
+                        break
+        self.invalidate_capabilities()
 
     def get_module(self, module_name):
-        """Returns the first module in self.modules whose name matches module_name (case-insensitive)."""
-        for mod in self.modules:
-            if module_name == "FusionReactor":
-                if mod.name.lower() == "nerva":
-                    return mod
-            if mod.name.lower() == module_name.lower():
-                return mod
-        return None
+        """Returns the installed module registered under module_name (e.g. "Drill", "NERVA" or "FusionReactor"), or None."""
+        return self.module_registry.get(module_name)
+
+    @property
+    def capabilities(self):
+        """The player's current Capabilities snapshot."""
+        if self._capabilities is None:
+            self._capabilities = Capabilities(self)
+        return self._capabilities
+
+    def invalidate_capabilities(self):
+        """Must be called whenever a module is upgraded or boosted."""
+        self._capabilities = None
 
     def __str__(self):
         return f"{self.symbol}"
@@ -0,0 +1,20 @@
+# rng.py
+"""
+Seeding helpers for reproducible games.
+Every Game draws all of its randomness from its own random.Random stream.
+Batches of games (benchmarks, parallel simulations) derive one independent seed per game
+from a single base seed with NumPy's SeedSequence, so the seed of game i depends only
+on (base_seed, i) and not on which process plays it or in which order.
+"""
+import numpy as np
+
+
+def derive_seed(base_seed, *key):
+    """Returns a 64-bit seed for the child stream identified by key, e.g. derive_seed(base, game_index)."""
+    sequence = np.random.SeedSequence(base_seed, spawn_key=tuple(key))
+    return int(sequence.generate_state(1, np.uint64)[0])
+
+
+def spawn_seeds(base_seed, count):
+    """Returns the seeds of the first count child streams of base_seed."""
+    return [derive_seed(base_seed, i) for i in range(count)]
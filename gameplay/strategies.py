@@ -0,0 +1,125 @@
+# strategies.py
+"""
+Scripted players for headless games.
+A strategy drives GameEngine for the current player until its turn ends,
+and records when it bought upgrades so simulations can report upgrade timing.
+"""
+import random
+
+from constants import manhattan_distance
+
+from .modules import MODULE_CATALOG
+
+
+class Strategy:
+    """
+    Base class for all strategies.
+    play_turn() must end the current player's turn (or the game).
+    """
+    name = "base"
+    max_actions_per_turn = 20
+
+    def __init__(self, rng=None):
+        self.rng = rng if rng is not None else random.Random()
+        self.upgrade_turns = []  # game turn of every successful upgrade or purchase
+
+    def play_turn(self, engine):
+        for _ in range(self.max_actions_per_turn):
+            result = self.take_action(engine)
+            if result.event:
+                result = engine.confirm_event()
+            if result.turn_ended or result.game_over:
+                return result
+        # Never let a scripted player stall the game.
+        return engine.pass_turn()
+
+    def take_action(self, engine):
+        """Takes one action (instant or turn-ending) and returns its ActionResult."""
+        raise NotImplementedError
+
+    def record_upgrade(self, engine, result):
+        if result.success:
+            self.upgrade_turns.append(engine.game.turn)
+        return result
+
+
+class RandomStrategy(Strategy):
+    """
+    Plays uniformly random legal actions: occasional upgrades, purchases and plantings,
+    then mines, moves or passes.
+    """
+    name = "random"
+
+    def take_action(self, engine):
+        game = engine.game
+        player = engine.current_player
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.05 and player.modules:
+            self.record_upgrade(engine, engine.upgrade_module(rng.choice(player.modules)))
+        elif roll < 0.08:
+            self.record_upgrade(engine, engine.buy_module(rng.choice(list(MODULE_CATALOG))))
+        targets = game.get_remote_plant_targets(player)
+        if targets and player.money >= 100 and rng.random() < 0.5:
+            engine.plant_robot(rng.choice(sorted(targets)))
+        if game.get_active_asteroid_at(player.x, player.y) is not None and rng.random() < 0.5:
+            return engine.mine()
+        allowed, error = game.get_allowed_moves(player)
+        allowed.discard((player.x, player.y))
+        if error or not allowed:
+            return engine.pass_turn()
+        return engine.move(rng.choice(sorted(allowed)))
+
+
+class GreedyStrategy(Strategy):
+    """
+    Mines whenever standing on an asteroid, plants robots on the most valuable targets,
+    upgrades the Drill when comfortably affordable and otherwise heads for the most
+    valuable discovered asteroid.
+    """
+    name = "greedy"
+
+    def take_action(self, engine):
+        game = engine.game
+        player = engine.current_player
+        drill = player.get_module("Drill")
+        if drill is not None and player.money >= 2 * drill.upgrade_cost and drill.level < 7:
+            self.record_upgrade(engine, engine.upgrade_module(drill))
+        targets = game.get_remote_plant_targets(player)
+        if targets and player.money >= 100:
+            best = max(sorted(targets), key=lambda c: self.asteroid_worth(game.get_asteroid_at(*c)))
+            engine.plant_robot(best)
+        if game.get_active_asteroid_at(player.x, player.y) is not None:
+            return engine.mine()
+        allowed, error = game.get_allowed_moves(player)
+        if error or not allowed:
+            return engine.pass_turn()
+        goal = self.pick_goal(game, player)
+        if goal is None:
+            return engine.move(self.rng.choice(sorted(allowed)))
+        if goal in allowed:
+            return engine.move(goal)
+        step = min(sorted(allowed), key=lambda c: manhattan_distance(c[0], c[1], goal[0], goal[1]))
+        if step == (player.x, player.y):
+            return engine.pass_turn()
+        return engine.move(step)
+
+    @staticmethod
+    def asteroid_worth(asteroid):
+        return asteroid.resource * asteroid.value
+
+    def pick_goal(self, game, player):
+        best, best_score = None, 0
+        for a in game.asteroids:
+            if a.is_exhausted() or (a.x, a.y) not in game.discovered_tiles:
+                continue
+            score = self.asteroid_worth(a) / (1 + manhattan_distance(player.x, player.y, a.x, a.y))
+            if score > best_score:
+                best, best_score = (a.x, a.y), score
+        return best
+
+
+STRATEGIES = {
+    RandomStrategy.name: RandomStrategy,
+    GreedyStrategy.name: GreedyStrategy,
+}
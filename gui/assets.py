@@ -0,0 +1,140 @@
+import threading
+
+from PIL import Image, ImageTk
+
+from gameplay.modules import MODULE_CATALOG
+
+# ----------------------------------------------------------------------
+# Image assets
+# Every module image filename is resolved here, and every image file is decoded at most
+# once per process. Panels ask ASSETS for Pillow images (for compositing) or Tk images
+# (for widgets) instead of opening files themselves.
+# ----------------------------------------------------------------------
+ASSET_DIR = "gui/modules"
+BLANK_IMAGE = "Blank.png"
+SHIP_IMAGE = "ship.png"
+SHIP_IMAGE_SIZE = (240, 240)
+SHIP_MODULE_SIZE = (64, 64)
+# Image filename stems of the modules that only have a base and an "_upgrade" image.
+SPECIAL_MODULE_IMAGES = {
+    "icepenetrator": "Ice_penetrator",
+    "nerva": "NERVA",
+    "explosiveslab": "Explosives_lab",
+    "warpdrive": "Warp_drive",
+}
+MAX_MODULE_LEVEL = 7
+
+
+def module_image_filename(mod_name, level):
+    """
+    Returns the image filename for a module of the given name and level.
+    """
+    stem = SPECIAL_MODULE_IMAGES.get(mod_name.lower())
+    if stem is not None:
+        return stem + ".png" if level == 1 else stem + "_upgrade.png"
+    if mod_name.lower() == "launchbay":
+        return f"Launch_Bay{level}.png"
+    return f"{mod_name}{level}.png"
+
+
+class AssetManager:
+    """
+    Process-wide cache of decoded images.
+      - pil(filename): Pillow image (shared; copy before modifying). Missing files resolve to Blank.png.
+      - tk(filename): Tk PhotoImage of the same image (main thread only; needs a Tk root).
+      - module_pil / module_tk(name, level): the image of a module at a level.
+      - ship_image(module_key): the ship composited with its modules (see ship_tk).
+      - preload(background): decodes every known image up front, optionally on a worker thread.
+    """
+    def __init__(self, asset_dir=ASSET_DIR):
+        self.asset_dir = asset_dir
+        self._lock = threading.Lock()
+        self._pil = {}  # filename -> decoded RGBA image
+        self._tk = {}  # filename -> PhotoImage
+        self._ships = {}  # module key -> PhotoImage of the composited ship
+        self._preload_thread = None
+
+    def _decode(self, filename):
+        try:
+            return Image.open(f"{self.asset_dir}/{filename}").convert("RGBA")
+        except Exception:
+            if filename == BLANK_IMAGE:
+                raise
+            return self.pil(BLANK_IMAGE)
+
+    def pil(self, filename):
+        with self._lock:
+            image = self._pil.get(filename)
+        if image is None:
+            image = self._decode(filename)
+            with self._lock:
+                image = self._pil.setdefault(filename, image)
+        return image
+
+    def tk(self, filename):
+        image = self._tk.get(filename)
+        if image is None:
+            image = ImageTk.PhotoImage(self.pil(filename))
+            self._tk[filename] = image
+        return image
+
+    def module_pil(self, mod_name, level):
+        return self.pil(module_image_filename(mod_name, level))
+
+    def module_tk(self, mod_name, level):
+        return self.tk(module_image_filename(mod_name, level))
+
+    def ship_image(self, module_key):
+        """
+        Returns the ship with the module images pasted on it, resized to SHIP_IMAGE_SIZE.
+        module_key is the ordered tuple of (module name, level) of the ship's modules.
+        """
+        ship_img = self.pil(SHIP_IMAGE).copy()
+        start_x, start_y = 170, 130
+        offset_x, offset_y = 110, 90
+        columns = 2
+        for index, (mod_name, level) in enumerate(module_key):
+            mod_img = self.module_pil(mod_name, level).resize(SHIP_MODULE_SIZE)
+            col = index % columns
+            row = index // columns
+            pos_x = start_x + col * offset_x
+            pos_y = start_y + row * offset_y
+            ship_img.paste(mod_img, (pos_x, pos_y), mod_img)
+        return ship_img.resize(SHIP_IMAGE_SIZE)
+
+    def ship_tk(self, module_key):
+        """PhotoImage of ship_image(module_key), composited once per module configuration."""
+        image = self._ships.get(module_key)
+        if image is None:
+            image = ImageTk.PhotoImage(self.ship_image(module_key))
+            self._ships[module_key] = image
+        return image
+
+    def known_filenames(self):
+        """Every image the game can ask for: ship, blank and each catalogue module at each level."""
+        filenames = {SHIP_IMAGE, BLANK_IMAGE}
+        for mod_name in MODULE_CATALOG:
+            for level in range(1, MAX_MODULE_LEVEL + 1):
+                filenames.add(module_image_filename(mod_name, level))
+        return sorted(filenames)
+
+    def preload(self, background=False):
+        """
+        Decodes every known image into the Pillow cache. With background=True the decoding
+        runs on a daemon thread and this returns immediately; Tk images are still created
+        lazily on the main thread.
+        """
+        def load_all():
+            for filename in self.known_filenames():
+                try:
+                    self.pil(filename)
+                except Exception as e:
+                    print("Error loading image:", filename, e)
+        if not background:
+            load_all()
+        elif self._preload_thread is None:
+            self._preload_thread = threading.Thread(target=load_all, name="asset-preload", daemon=True)
+            self._preload_thread.start()
+
+
+ASSETS = AssetManager()
@@ -1,11 +1,13 @@
 
 import tkinter as tk
 
-from gameplay import Game
+from gameplay import Game, GameEngine
+from gameplay.log import DETAIL_KINDS
 
 from constants import *  # Must include color constants, FONT_FAMILY, manhattan_distance, TIMER_DELAY_MS, etc.
 
 from .panels import UpgradeGUI, LeaderboardGUI, AsteroidGraphGUI
+from .timer import TurnTimer
 
 
 
@@ -17,6 +19,8 @@ class GameGUIBase(tk.Tk):
     def __init__(self, game: Game):
         super().__init__()
         self.game = game
+        # All rules and turn sequencing live in the engine; this class only renders its results.
+        self.engine = GameEngine(game)
 
         # UI–mode flags (these are not widget references but control the logic)
         self.move_mode = False
@@ -32,12 +36,15 @@ class GameGUIBase(tk.Tk):
         self.asteroid_stats_window = None
         self.upgrade_window = None
 
-        # Timer state
-        self.timer_paused = False
-        self.turn_timer_remaining = self.game.settings.turn_timer_duration
+        # Timer state (the turn passes automatically when the timer expires)
+        self.turn_timer = TurnTimer(self, self.game.settings.turn_timer_duration,
+                                    on_expire=self.on_turn_timeout, on_tick=self.update_timer_display)
 
         self.lens = None
 
+        # Set while a redraw is scheduled for the next idle cycle (see request_redraw)
+        self.redraw_pending = False
+
     # -------------------------
     # Abstract / “hook” methods
     # -------------------------
@@ -60,9 +67,24 @@ class GameGUIBase(tk.Tk):
         """
         Update the display based on game state.
         Override this method in the subclass to update all UI widgets.
+        Game interaction methods call request_redraw() rather than this directly.
         """
         raise NotImplementedError
 
+    def request_redraw(self):
+        """
+        Marks the display dirty. However many times this is called while handling one
+        click, update_display() runs once, when Tk next goes idle.
+        """
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.redraw)
+
+    def redraw(self):
+        if self.redraw_pending:
+            self.redraw_pending = False
+            self.update_display()
+
     def create_widgets(self):
         """
         Create and layout all UI widgets.
@@ -95,6 +117,12 @@ class GameGUIBase(tk.Tk):
         """
         print(message)
 
+    def log_records(self, records):
+        """Logs engine LogRecords, skipping per-robot detail (its per-player summary is logged instead)."""
+        for record in records:
+            if record.kind not in DETAIL_KINDS:
+                self.log(record.format())
+
     def on_grid_click(self, x: int, y: int):
         # If in debris deployment mode:
         if self.debris_mode:
@@ -109,31 +137,18 @@ class GameGUIBase(tk.Tk):
         if self.move_mode:
             if (x, y) in self.allowed_moves:
                 active = self.game.get_current_player()
-                success, result = self.game.move_player(active, (x, y))
-                if not success:
-                    self.log(result)
+                result = self.engine.move((x, y))
+                if not result.success:
+                    self.log_records(result.records)
                 else:
-                    message, event, path, asteroid = result
-                    self.log(message)
-                    if event:
-                        self.move_mode = False
-                        self.allowed_moves = set()
-                        self.selected_tile = None
-                        self.pause_timer_and_show_event(asteroid, event, active)
-                        return
                     self.move_mode = False
                     self.allowed_moves = set()
                     self.selected_tile = None
-                    warp = active.get_module("WarpDrive")
-                    if warp is None:
-                        self.reset_timer()
-                        self.next_turn()
-                    else:
-                        if warp.level > 1 and (x, y) not in [(a.x, a.y) for a in self.game.asteroids] and not warp.used_this_turn:
-                            warp.used_this_turn = True
-                        else:
-                            self.reset_timer()
-                            self.next_turn()
+                    if result.event:
+                        self.log_records(result.records)
+                        self.pause_timer_and_show_event(result.asteroid, result.event, active)
+                        return
+                    self.apply_result(result)
             else:
                 self.log("Tile not allowed for movement.")
             return
@@ -141,19 +156,11 @@ class GameGUIBase(tk.Tk):
         # If in remote planting mode:
         if self.remote_plant_mode:
             if (x, y) in self.allowed_remote_cells:
-                active = self.game.get_current_player()
-                target = next((a for a in self.game.asteroids if a.x == x and a.y == y), None)
-                if target is None:
-                    self.log("No asteroid on this tile.")
-                else:
-                    message, _ = self.game.remote_plant_robot(active, target)
-                    factory = active.get_module("Factory")
-                    if factory is not None:
-                        factory.robots_produced_this_turn += 1
-                    self.log(message)
-                    self.remote_plant_mode = False
-                    self.allowed_remote_cells = set()
-                    self.update_display()
+                result = self.engine.plant_robot((x, y))
+                self.log_records(result.records)
+                self.remote_plant_mode = False
+                self.allowed_remote_cells = set()
+                self.request_redraw()
                 return
             else:
                 self.log("Tile not allowed for planting.")
@@ -165,106 +172,81 @@ class GameGUIBase(tk.Tk):
         if (x, y) not in self.game.discovered_tiles:
             info += "Not discovered yet."
         else:
-            players_here = [p for p in self.game.players if p.x == x and p.y == y]
-            asteroids_here = [a for a in self.game.asteroids if a.x == x and a.y == y]
+            players_here = self.game.get_players_at(x, y)
+            asteroid_here = self.game.get_asteroid_at(x, y)
             if players_here:
                 info += "Players: " + ", ".join(str(p) for p in players_here) + "\n"
-            if asteroids_here:
-                for a in asteroids_here:
-                    info += f"A{a.id}: {a.resource:.0f} resource, value:{a.value:.2f} ({'visited' if a.visited else 'undiscovered'})"
-                    if a.robot:
-                        info += f" (Robot: {a.robot.owner.symbol}, Cap: {a.robot.capacity})"
-                    info += "\n"
-            if not players_here and not asteroids_here:
+            if asteroid_here:
+                a = asteroid_here
+                info += f"A{a.id}: {a.resource:.0f} resource, value:{a.value:.2f} ({'visited' if a.visited else 'undiscovered'})"
+                if a.robot:
+                    info += f" (Robot: {a.robot.owner.symbol}, Cap: {a.robot.capacity})"
+                info += "\n"
+            if not players_here and not asteroid_here:
                 info += "Empty tile."
         self.handle_tile_info(info)
-        self.update_display()
+        self.request_redraw()
 
     def move_player(self):
         self.cancel_pending_actions()
-        active = self.game.get_current_player()
-        allowed, error = self.game.get_allowed_moves(active)
-        if error:
-            self.log(error)
+        actions = self.game.get_available_actions()
+        if actions.move_error:
+            self.log(actions.move_error)
             return
-        self.allowed_moves = allowed
+        self.allowed_moves = actions.moves
         self.move_mode = True
         self.log("Select a highlighted tile to move to.")
-        self.update_display()
+        self.request_redraw()
 
     def mine_action(self):
         self.cancel_pending_actions()
-        active = self.game.get_current_player()
-        asteroid = next((a for a in self.game.asteroids
-                         if a.x == active.x and a.y == active.y and not a.is_exhausted()), None)
-        if asteroid is None:
-            self.log("No asteroid available for mining on this tile.")
-        else:
-            result = self.game.manual_mine(active, asteroid)
-            self.log(result)
-        self.update_display()
-        self.reset_timer()
-        self.next_turn()
+        self.apply_result(self.engine.mine())
 
     def pass_action(self):
         self.cancel_pending_actions()
-        self.log(f"{self.game.get_current_player().symbol} passes.")
-        self.update_display()
-        self.reset_timer()
-        self.next_turn()
+        self.apply_result(self.engine.pass_turn())
 
     def remote_plant_robot(self):
         self.cancel_pending_actions()
-        active = self.game.get_current_player()
+        actions = self.game.get_available_actions()
         self.remote_plant_mode = True
-        self.allowed_remote_cells = self.game.get_remote_plant_targets(active)
-        if self.allowed_remote_cells and active.money >= 100:
+        self.allowed_remote_cells = actions.plant_targets
+        if actions.can_plant:
             self.log("Select a highlighted asteroid tile to plant a robot ($100).")
         else:
             self.log("No valid asteroid targets available for planting.")
             self.remote_plant_mode = False
-        self.update_display()
+        self.request_redraw()
 
     def hijack_robot(self):
         self.cancel_pending_actions()
-        active = self.game.get_current_player()
-        result, flag = self.game.hijack_robot(active)
-        self.log(result)
-        self.update_display()
-        if flag:
-            self.next_turn()
+        self.apply_result(self.engine.hijack())
 
     def deploy_debris_torpedo(self):
-        active = self.game.get_current_player()
         if not self.debris_mode:
-            allowed = self.game.get_debris_targets(active)
+            allowed = self.game.get_available_actions().debris_targets
             if not allowed:
                 self.log("No valid debris deployment targets available.")
                 return
             self.debris_mode = True
             self.allowed_debris_cells = allowed
             self.log("Select a highlighted tile to deploy debris torpedo.")
-            self.update_display()
+            self.request_redraw()
             return
         else:
             if self.selected_tile not in self.allowed_debris_cells:
                 self.log("Selected tile is not a valid debris deployment target.")
                 return
-            success, message = self.game.deploy_debris(active, self.selected_tile)
-            if not success:
-                self.log(message)
+            result = self.engine.deploy_debris(self.selected_tile)
+            self.log_records(result.records)
+            if not result.success:
                 return
-            self.log(message)
             self.debris_mode = False
             self.allowed_debris_cells = set()
-            self.update_display()
+            self.request_redraw()
 
     def upgrade_all_robots(self):
-        active = self.game.get_current_player()
-        messages = self.game.upgrade_all_robots(active)
-        for msg in messages:
-            self.log(msg)
-        self.update_display()
+        self.apply_result(self.engine.upgrade_robots())
 
     def open_asteroid_graph_window(self):
         self.cancel_pending_actions()
@@ -290,20 +272,23 @@ class GameGUIBase(tk.Tk):
             self.upgrade_window = None
         self.upgrade_window = UpgradeGUI(self, self.game, active)
 
-    def next_turn(self):
-        if self.upgrade_window is not None:
+    def apply_result(self, result):
+        """
+        Logs the messages of an engine ActionResult and refreshes the UI.
+        When the action ended the turn, closes the upgrade window and restarts the turn timer.
+        """
+        if result.turn_ended and self.upgrade_window is not None:
             self.upgrade_window.destroy()
             self.upgrade_window = None
-        self.game.robot_mining(self.log)
-        self.log(f"--- End of Turn {self.game.turn} ---")
-        if self.game.is_game_over():
-            self.log("All asteroids exhausted. Game over!")
+        self.log_records(result.records)
+        if result.game_over:
+            self.turn_timer.stop()
             self.disable_controls()
             return
-        self.game.next_turn()
-        self.selected_tile = None
-        self.reset_timer()
-        self.update_display()
+        if result.turn_ended:
+            self.selected_tile = None
+            self.reset_timer()
+        self.request_redraw()
 
     def cancel_pending_actions(self):
         self.move_mode = False
@@ -313,30 +298,36 @@ class GameGUIBase(tk.Tk):
         self.allowed_remote_cells = set()
         self.allowed_debris_cells = set()
         self.selected_tile = None
-        self.update_display()
+        self.request_redraw()
+
+    @property
+    def turn_timer_remaining(self):
+        """Whole seconds left in the current turn."""
+        return self.turn_timer.seconds_left()
+
+    @property
+    def timer_paused(self):
+        return "user" in self.turn_timer.pause_reasons
+
+    def start_timer(self):
+        self.turn_timer.start()
 
     def reset_timer(self):
-        self.turn_timer_remaining = self.game.settings.turn_timer_duration
-        self.update_timer_display()
-
-    def update_timer(self):
-        if not self.timer_paused:
-            self.turn_timer_remaining -= 1
-        self.update_timer_display()
-        if self.turn_timer_remaining <= 0:
-            self.pass_action()
-            self.reset_timer()
-            self.update_timer()
-        else:
-            self.after(TIMER_DELAY_MS, self.update_timer)
+        self.turn_timer.start()
+
+    def on_turn_timeout(self):
+        self.pass_action()
 
     def toggle_timer(self):
-        self.timer_paused = not self.timer_paused
+        if self.timer_paused:
+            self.turn_timer.resume("user")
+        else:
+            self.turn_timer.pause("user")
         state = "paused" if self.timer_paused else "running"
         self.log(f"Timer {state}.")
 
     def pause_timer_and_show_event(self, asteroid, event, player):
-        self.timer_paused = True
+        self.turn_timer.pause("event")
         event_text = event if event is not None else f"You have encountered a mysterious event on Asteroid A{asteroid.id}."
         self.event_window = tk.Toplevel(self)
         self.event_window.title(f"Asteroid Event A{asteroid.id}")
@@ -357,28 +348,25 @@ class GameGUIBase(tk.Tk):
         if hasattr(self, 'event_window') and self.event_window:
             self.event_window.destroy()
             self.event_window = None
-        self.timer_paused = False
-        self.update_display()
-        self.next_turn()
+        self.turn_timer.resume("event")
+        self.apply_result(self.engine.confirm_event())
 
     # -------------------------
     # Utility formatting methods (can be used by the subclass)
     # -------------------------
     def format_player_info(self, player):
-        drill = player.get_module("Drill")
-        telescope = player.get_module("Telescope")
+        capabilities = player.capabilities
         reactor = player.get_module("Reactor")
-        launch_bay = player.get_module("LaunchBay")
         factory = player.get_module("Factory")
         info = f"{player.symbol}\n"
-        info += f"   Drill (Mining Capacity): {drill.mining_capacity if drill else 'None'}\n"
-        info += f"   Telescope (Discovery Range): {telescope.discovery_range if telescope else 'None'}\n"
-        info += f"   Reactor (Movement Range): {reactor.movement_range if reactor else 'None'}\n\n"
-        info += f"   LaunchBay (Robot Range): {launch_bay.robot_range if launch_bay else 'None'}\n"
-        info += f"   Factory (Robot Capacity): {factory.robot_capacity if factory else 'None'}\n"
+        info += f"   Drill (Mining Capacity): {capabilities.mining_capacity}\n"
+        info += f"   Telescope (Discovery Range): {capabilities.discovery_range}\n"
+        info += f"   Reactor (Movement Range): {capabilities.movement_range if reactor else 'None'}\n\n"
+        info += f"   LaunchBay (Robot Range): {capabilities.robot_range}\n"
+        info += f"   Factory (Robot Capacity): {capabilities.robot_capacity}\n"
         if factory is not None:
-            left = factory.robot_production - factory.robots_produced_this_turn
-            total = factory.robot_production
+            left = capabilities.robot_production - factory.robots_produced_this_turn
+            total = capabilities.robot_production
             info += f"   Robots produced this turn: {left}/{total}\n"
         info += f"   Money earned by robots: {int(player.money_earned_by_robots)}\n"
         return info
@@ -386,10 +374,10 @@ class GameGUIBase(tk.Tk):
     def format_current_tile_info(self, player):
         x, y = player.x, player.y
         info = f"Tile ({x},{y}):\n"
-        others = [p for p in self.game.players if p.x == x and p.y == y and p != player]
+        others = [p for p in self.game.get_players_at(x, y) if p != player]
         if others:
             info += "Other Players: " + ", ".join(str(p) for p in others) + "\n"
-        asteroid = next((a for a in self.game.asteroids if a.x == x and a.y == y), None)
+        asteroid = self.game.get_asteroid_at(x, y)
         if asteroid:
             info += f"Asteroid A{asteroid.id} ({asteroid.asteroid_type}): {asteroid.resource:.0f} resources, value:{asteroid.value:.2f}"
             if asteroid.robot:
@@ -401,38 +389,20 @@ class GameGUIBase(tk.Tk):
 
     # -------------------------
     # Helper methods for checking action availability in UI
-    # (These mirror the earlier checks in the original GameGUI.)
+    # (All read the game's AvailableActions, computed once per state change.)
     # -------------------------
     def game_has_upgrade_robots_available(self):
-        active = self.game.get_current_player()
-        launch_bay = active.get_module("LaunchBay")
-        factory = active.get_module("Factory")
-        if launch_bay is None or factory is None:
-            return False
-        return any(
-            a.robot and a.robot.owner == active and
-            manhattan_distance(active.x, active.y, a.x, a.y) <= launch_bay.robot_range and
-            a.robot.capacity < factory.robot_capacity
-            for a in self.game.asteroids
-        )
+        return self.game.get_available_actions().can_upgrade_robots
+
+    def game_has_plant_available(self):
+        return self.game.get_available_actions().can_plant
 
     def game_has_debris_available(self):
-        active = self.game.get_current_player()
-        return bool(self.game.get_debris_targets(active)) and active.money >= 200
+        return self.game.get_available_actions().can_deploy_debris
 
     def game_has_mine_available(self):
-        active = self.game.get_current_player()
-        drill = active.get_module("Drill")
-        if drill is None:
-            return False
-        return any(a for a in self.game.asteroids
-                   if a.x == active.x and a.y == active.y and not a.is_exhausted())
+        return self.game.get_available_actions().can_mine
 
     def game_has_hijack_available(self):
-        active = self.game.get_current_player()
-        return any(
-            a for a in self.game.asteroids
-            if a.x == active.x and a.y == active.y and a.robot is not None and
-            a.robot.owner != active and not a.is_exhausted()
-        )
+        return self.game.get_available_actions().can_hijack
 
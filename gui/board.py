@@ -0,0 +1,99 @@
+import tkinter as tk
+
+from constants import *
+
+# ----------------------------------------------------------------------
+# Board renderers
+# Both draw a gameplay BoardView and report clicks as on_click(x, y) with grid
+# coordinates. Each remembers the frame on screen and only redraws changed tiles.
+# ----------------------------------------------------------------------
+class LabelBoard(tk.Frame):
+    """
+    One Label widget per cell. Fine for small maps; widget count grows with W*H.
+    """
+    def __init__(self, parent, width, height, on_click):
+        super().__init__(parent, bg=DARK_BG)
+        self.displayed_board = None
+        self.cell_labels = []
+        for y in range(height):
+            row_labels = []
+            for x in range(width):
+                lbl = tk.Label(self, text="??",
+                               width=GRID_CELL_WIDTH, height=GRID_CELL_HEIGHT,
+                               borderwidth=1, relief="solid",
+                               bg=UNDISCOVERED_BG, fg=DARK_FG, font=FONT_NORMAL)
+                lbl.grid(row=y, column=x, padx=UI_PADDING_GRID_CELL, pady=UI_PADDING_GRID_CELL)
+                lbl.bind("<Button-1>", lambda e, x=x, y=y: on_click(x, y))
+                row_labels.append(lbl)
+            self.cell_labels.append(row_labels)
+
+    def draw(self, board):
+        for x, y in board.changed_cells(self.displayed_board):
+            text, bg_color, fg_color = board.tile(x, y)
+            self.cell_labels[y][x].config(text=text, bg=bg_color, fg=fg_color)
+        self.displayed_board = board
+
+
+class CanvasBoard(tk.Frame):
+    """
+    A single Canvas holding one rectangle and one text item per cell, created once and
+    reconfigured in place. Clicks are mapped to cells arithmetically. Scrolls when the
+    board is larger than CANVAS_BOARD_MAX_VIEW.
+    """
+    def __init__(self, parent, width, height, on_click):
+        super().__init__(parent, bg=DARK_BG)
+        self.displayed_board = None
+        self.on_click = on_click
+        self.grid_width = width
+        self.grid_height = height
+        size = CANVAS_CELL_SIZE
+        total_w, total_h = width * size, height * size
+        self.canvas = tk.Canvas(self, width=min(total_w, CANVAS_BOARD_MAX_VIEW),
+                                height=min(total_h, CANVAS_BOARD_MAX_VIEW),
+                                bg=DARK_BG, highlightthickness=0,
+                                scrollregion=(0, 0, total_w, total_h))
+        self.canvas.grid(row=0, column=0)
+        if total_w > CANVAS_BOARD_MAX_VIEW:
+            xscroll = tk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
+            xscroll.grid(row=1, column=0, sticky="ew")
+            self.canvas.config(xscrollcommand=xscroll.set)
+        if total_h > CANVAS_BOARD_MAX_VIEW:
+            yscroll = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+            yscroll.grid(row=0, column=1, sticky="ns")
+            self.canvas.config(yscrollcommand=yscroll.set)
+
+        # Item ids by [y][x]; items are never deleted, only reconfigured.
+        self.rect_items = []
+        self.text_items = []
+        for y in range(height):
+            rect_row, text_row = [], []
+            for x in range(width):
+                x0, y0 = x * size, y * size
+                rect_row.append(self.canvas.create_rectangle(x0, y0, x0 + size - 1, y0 + size - 1,
+                                                             fill=UNDISCOVERED_BG, outline=DARK_BG))
+                text_row.append(self.canvas.create_text(x0 + size / 2, y0 + size / 2, text="??",
+                                                        fill=DARK_FG, font=FONT_CANVAS_CELL))
+            self.rect_items.append(rect_row)
+            self.text_items.append(text_row)
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+
+    def on_canvas_click(self, event):
+        x = int(self.canvas.canvasx(event.x) // CANVAS_CELL_SIZE)
+        y = int(self.canvas.canvasy(event.y) // CANVAS_CELL_SIZE)
+        if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+            self.on_click(x, y)
+
+    def draw(self, board):
+        itemconfig = self.canvas.itemconfig
+        for x, y in board.changed_cells(self.displayed_board):
+            text, bg_color, fg_color = board.tile(x, y)
+            itemconfig(self.rect_items[y][x], fill=bg_color)
+            itemconfig(self.text_items[y][x], text=text, fill=fg_color)
+        self.displayed_board = board
+
+
+def make_board(parent, width, height, on_click):
+    """Returns the board renderer suited to a width x height grid."""
+    if width * height >= CANVAS_BOARD_MIN_CELLS:
+        return CanvasBoard(parent, width, height, on_click)
+    return LabelBoard(parent, width, height, on_click)
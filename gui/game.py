@@ -1,12 +1,13 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 
 from gameplay import Game
+from gameplay.events import BOARD_KINDS, RESOURCE_CHANGED, DISCOVERY_CHANGED
 
 from constants import *
 
-from .utils import get_module_image_pil
+from .assets import ASSETS
 from .action import ActionPanel
+from .board import make_board
 from .base import GameGUIBase
 
 # =============================================================================
@@ -17,11 +18,18 @@ from .base import GameGUIBase
 class GameGUI(GameGUIBase):
     def __init__(self, game: Game):
         super().__init__(game)
+        self.pending_log_lines = []  # flushed into log_text in one insert per idle cycle
+        self.pending_events = []  # GameEvents published since the last update_display
+        self.game.events.subscribe(self.pending_events.append)
+        self.base_board = None  # last rendered BoardView without UI highlights
+        self.base_board_lens = None
+        self.shown_selection = None
+        ASSETS.preload(background=True)
         self.title("Space Mining Game")
         self.configure(bg=DARK_BG)
         self.create_widgets()
         self.update_display()
-        self.update_timer()
+        self.start_timer()
 
     # -------------------------
     # Create all UI widgets
@@ -45,7 +53,7 @@ class GameGUI(GameGUIBase):
 
         def change_lens(name):
             self.lens = name
-            self.update_display()
+            self.request_redraw()
 
         tk.Button(ui_panel_frame, text="Default view",
                   command=lambda: change_lens(None),
@@ -70,21 +78,9 @@ class GameGUI(GameGUIBase):
                                     font=FONT_TIMER)
         self.timer_label.pack(side="right", padx=UI_PADDING_MEDIUM)
 
-        # Game Board (Grid)
-        self.grid_frame = tk.Frame(self, bg=DARK_BG)
-        self.grid_frame.grid(row=1, column=0, padx=UI_PADDING_MEDIUM, pady=UI_PADDING_MEDIUM)
-        self.cell_labels = []
-        for y in range(self.game.grid_height):
-            row_labels = []
-            for x in range(self.game.grid_width):
-                lbl = tk.Label(self.grid_frame, text="??",
-                               width=GRID_CELL_WIDTH, height=GRID_CELL_HEIGHT,
-                               borderwidth=1, relief="solid",
-                               bg=UNDISCOVERED_BG, fg=DARK_FG, font=FONT_NORMAL)
-                lbl.grid(row=y, column=x, padx=UI_PADDING_GRID_CELL, pady=UI_PADDING_GRID_CELL)
-                lbl.bind("<Button-1>", lambda e, x=x, y=y: self.on_grid_click(x, y))
-                row_labels.append(lbl)
-            self.cell_labels.append(row_labels)
+        # Game Board (Grid): one Label per cell on small maps, a single Canvas on large ones
+        self.board = make_board(self, self.game.grid_width, self.game.grid_height, self.on_grid_click)
+        self.board.grid(row=1, column=0, padx=UI_PADDING_MEDIUM, pady=UI_PADDING_MEDIUM)
 
         # Right frame for log and player info
         self.right_frame = tk.Frame(self, bg=DARK_BG)
@@ -120,7 +116,7 @@ class GameGUI(GameGUIBase):
         self.actions_frame.grid(row=2, column=0, columnspan=2, padx=UI_PADDING_MEDIUM, sticky="n")
         instant_actions_data = [
             ("Upgrade Robots", self.upgrade_all_robots, lambda: self.game_has_upgrade_robots_available()),
-            (f"Plant Robot ($100)", self.remote_plant_robot, lambda: self.game.get_remote_plant_targets(self.game.get_current_player()) and self.game.get_current_player().money >= 100),
+            (f"Plant Robot ($100)", self.remote_plant_robot, lambda: self.game_has_plant_available()),
             ("Deploy Debris Torpedo ($200)", self.deploy_debris_torpedo, lambda: self.game_has_debris_available())
         ]
         self.instant_actions_panel = ActionPanel(self.actions_frame, "Instant Actions", instant_actions_data,
@@ -166,75 +162,95 @@ class GameGUI(GameGUIBase):
     # Display update methods
     # -------------------------
     def update_display(self):
-        # Update discovered tiles, money, and allowed moves
+        # Update discovered tiles, then collect what changed since the last frame.
         self.game.update_discovered()
+        events = list(self.pending_events)
+        self.pending_events.clear()
+        kinds = {event.kind for event in events}
+        first_frame = self.base_board is None
+        selection_changed = self.selected_tile != self.shown_selection
+        self.shown_selection = self.selected_tile
         active = self.game.get_current_player()
         self.money_label.config(text=f"${active.money:.0f}")
 
+        # Targets of the current mode come from the same per-state summary as the action buttons.
+        actions = self.game.get_available_actions(active)
         if self.move_mode:
-            allowed, error = self.game.get_allowed_moves(active)
-            if error:
+            if actions.move_error:
                 self.allowed_moves = set()
-                self.log(error)
+                self.log(actions.move_error)
             else:
-                self.allowed_moves = allowed
+                self.allowed_moves = actions.moves
         if self.remote_plant_mode:
-            self.allowed_remote_cells = self.game.get_remote_plant_targets(active)
+            self.allowed_remote_cells = actions.plant_targets
         if self.debris_mode:
-            self.allowed_debris_cells = self.game.get_debris_targets(active)
-
-        # Update each grid cell (tile)
-        for y in range(self.game.grid_height):
-            for x in range(self.game.grid_width):
-                base_props = self.game.get_base_tile_properties(x, y, active, lens=self.lens)
-                text = base_props["text"]
-                bg_color = base_props["bg"]
-                fg_color = base_props["fg"]
-                if self.move_mode and (x, y) in self.allowed_moves:
-                    bg_color = ALLOWED_MOVE_COLOR
-                elif self.remote_plant_mode and (x, y) in self.allowed_remote_cells:
-                    bg_color = REMOTE_ALLOWED_COLOR
-                if self.selected_tile == (x, y):
-                    bg_color = SELECTED_TILE_COLOR
-                if self.debris_mode and (x, y) in self.allowed_debris_cells:
-                    bg_color = DEBRIS_ALLOWED_COLOR
-                self.cell_labels[y][x].config(text=text, bg=bg_color, fg=fg_color)
-
-        # Update player ship display (modules)
-        self.update_ship_with_modules()
+            self.allowed_debris_cells = actions.debris_targets
+
+        # Re-render only the tiles the events touched. The resource and value lenses are
+        # normalised over all discovered asteroids, so mining or discovery recolours them all.
+        lens_changed = self.base_board_lens != self.lens
+        lens_stale = self.lens in ("resource", "value") and kinds & {RESOURCE_CHANGED, DISCOVERY_CHANGED}
+        if first_frame or lens_changed or lens_stale:
+            self.base_board = self.game.render_board(active, lens=self.lens)
+            self.base_board_lens = self.lens
+        elif kinds & BOARD_KINDS:
+            cells = [cell for event in events if event.kind in BOARD_KINDS for cell in event.cells]
+            self.base_board = self.game.render_board(active, lens=self.lens, cells=cells, base=self.base_board)
+        # Paint the UI highlights over a copy (later overlays win) and let the board
+        # redraw only the tiles that differ from the frame on screen.
+        board = self.base_board.copy()
+        if self.remote_plant_mode:
+            board.overlay_bg(self.allowed_remote_cells, REMOTE_ALLOWED_COLOR)
+        if self.move_mode:
+            board.overlay_bg(self.allowed_moves, ALLOWED_MOVE_COLOR)
+        if self.selected_tile is not None:
+            board.overlay_bg([self.selected_tile], SELECTED_TILE_COLOR)
+        if self.debris_mode:
+            board.overlay_bg(self.allowed_debris_cells, DEBRIS_ALLOWED_COLOR)
+        self.board.draw(board)
+
+        # Player panels follow any state change; the buttons also follow mode changes.
+        if first_frame or events:
+            self.update_ship_with_modules()
         self.current_tile_info_label.config(text=self.format_current_tile_info(active), fg=DARK_FG)
         self.instant_actions_panel.update_buttons()
         self.turn_actions_panel.update_buttons()
-        if self.leaderboard_window is not None:
+        if self.leaderboard_window is not None and (events or selection_changed):
             self.leaderboard_window.update_content()
-        if self.asteroid_stats_window is not None:
+        if self.asteroid_stats_window is not None and (selection_changed or kinds & BOARD_KINDS):
             self.asteroid_stats_window.update_content()
 
+    def log(self, message: str):
+        if not self.pending_log_lines:
+            self.after_idle(self.flush_log)
+        self.pending_log_lines.append(message)
+
+    def flush_log(self):
+        """Writes all pending log lines with a single insert and trims the widget to LOG_MAX_LINES."""
+        if not self.pending_log_lines:
+            return
+        lines, self.pending_log_lines = self.pending_log_lines, []
+        self.log_text.config(state="normal")
+        self.log_text.insert("end", "\n".join(lines) + "\n")
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
+        self.log_text.see("end")
+        self.log_text.config(state="disabled")
+
     def update_timer_display(self):
         self.timer_label.config(text=f"{self.turn_timer_remaining}")
 
     def update_ship_with_modules(self):
-        # Load the base ship image and paste module images onto it.
+        # The ship picture only changes with the module configuration, so ASSETS composites
+        # it (and converts it to a PhotoImage) once per distinct ordered (name, level) tuple.
+        active = self.game.get_current_player()
+        module_key = tuple((module.name, module.level) for module in active.modules)
         try:
-            ship_img = Image.open("gui/modules/ship.png").convert("RGBA")
+            self.ship_tk = ASSETS.ship_tk(module_key)
         except Exception as e:
             print("Error loading ship image:", e)
             return
-        start_x, start_y = 170, 130
-        offset_x, offset_y = 110, 90
-        columns = 2
-        active = self.game.get_current_player()
-        modules = active.modules
-        for index, module in enumerate(modules):
-            mod_img, _ = get_module_image_pil(module)
-            mod_img = mod_img.resize((64, 64))
-            col = index % columns
-            row = index // columns
-            pos_x = start_x + col * offset_x
-            pos_y = start_y + row * offset_y
-            ship_img.paste(mod_img, (pos_x, pos_y), mod_img)
-        ship_img = ship_img.resize((240, 240))
-        self.ship_tk = ImageTk.PhotoImage(ship_img)
         self.player_info_label.configure(image=self.ship_tk,
                                          text=self.format_player_info(active),
                                          fg=active.color)
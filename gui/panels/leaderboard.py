@@ -1,6 +1,100 @@
 import tkinter as tk
 from constants import *
 
+# (category, section title, value column header, value of a player, display of a value)
+LEADERBOARD_CATEGORIES = [
+    ("money", "Money Leaderboard", "Money",
+     lambda p: p.money, lambda val: f"${val:.0f}"),
+    ("upgrades", "Upgrades Leaderboard", "Upgrades",
+     lambda p: p.upgrades_purchased, lambda val: str(val)),
+    ("mined", "Total Mined Leaderboard", "Total Mined",
+     lambda p: p.total_mined, lambda val: str(val)),
+    ("robot_money", "Robot Turn Earnings Leaderboard", "Turn robot earnings",
+     lambda p: p.money_earned_by_robots, lambda val: f"${val:.0f}"),
+]
+
+
+class LeaderboardSection:
+    """
+    One ranked canvas. Every player owns a fixed set of canvas items (row background,
+    symbol, value, bar) created once; refresh() re-ranks the players and only moves
+    or reconfigures the items whose rank, value or highlight changed.
+    """
+    canvas_width = 400
+    row_height = 35
+    header_height = 30
+    col_positions = [10, 100, 250]
+
+    def __init__(self, parent, players, header_text, data_func, display_func, on_row_click):
+        self.players = players
+        self.data_func = data_func
+        self.display_func = display_func
+        self.ranking = list(players)  # players in rank order, kept nearly sorted between refreshes
+        self.shown = {}  # player -> (rank, value, highlighted, bar length) currently drawn
+        canvas_height = self.header_height + self.row_height * len(players) + 10
+        self.canvas = tk.Canvas(parent, width=self.canvas_width, height=canvas_height,
+                                bg=DARK_BG, highlightthickness=0)
+        self.canvas.pack(pady=5)
+        headers = ["Player", header_text, "Bar Chart"]
+        for i, h in enumerate(headers):
+            self.canvas.create_text(self.col_positions[i], 15, anchor="w", text=h,
+                                    fill=DARK_FG, font=FONT_SMALL)
+        self.items = {}  # player -> (row, symbol, value, bar) item ids
+        for index, p in enumerate(players):
+            row_tag = f"player_{index}"
+            row = self.canvas.create_rectangle(0, 0, 0, 0, fill=EMPTY_TILE_BG, outline="", tags=row_tag)
+            symbol = self.canvas.create_text(0, 0, anchor="w", text=p.symbol, fill=p.color,
+                                             font=FONT_SMALL, tags=row_tag)
+            value = self.canvas.create_text(0, 0, anchor="w", text="", fill=p.color,
+                                            font=FONT_SMALL, tags=row_tag)
+            bar = self.canvas.create_rectangle(0, 0, 0, 0, fill=p.color, outline=p.color, tags=row_tag)
+            self.canvas.tag_bind(row_tag, "<Button-1>", lambda event, p=p: on_row_click(p.x, p.y))
+            self.items[p] = (row, symbol, value, bar)
+
+    def rerank(self, values):
+        """
+        Restores descending order of self.ranking with an insertion sort: rankings change
+        little between refreshes, so this is close to linear instead of a full sort.
+        """
+        ranking = self.ranking
+        for i in range(1, len(ranking)):
+            p = ranking[i]
+            j = i
+            while j > 0 and values[ranking[j - 1]] < values[p]:
+                ranking[j] = ranking[j - 1]
+                j -= 1
+            ranking[j] = p
+
+    def refresh(self, selected_tile):
+        values = {p: self.data_func(p) for p in self.players}
+        self.rerank(values)
+        max_value = max(values.values()) if values else 1
+        bar_x = self.col_positions[2]
+        max_bar_length = self.canvas_width - bar_x - 20
+        canvas = self.canvas
+        for rank, p in enumerate(self.ranking):
+            value = values[p]
+            highlighted = selected_tile == (p.x, p.y)
+            bar_length = (value / max_value) * max_bar_length if max_value > 0 else 0
+            state = (rank, value, highlighted, bar_length)
+            previous = self.shown.get(p)
+            if previous == state:
+                continue
+            row, symbol, value_item, bar = self.items[p]
+            y = self.header_height + rank * self.row_height
+            if previous is None or previous[0] != rank:
+                canvas.coords(row, 5, y, self.canvas_width - 5, y + self.row_height)
+                canvas.coords(symbol, self.col_positions[0], y + self.row_height / 2)
+                canvas.coords(value_item, self.col_positions[1], y + self.row_height / 2)
+            if previous is None or previous[0] != rank or previous[3] != bar_length:
+                canvas.coords(bar, bar_x, y + 5, bar_x + bar_length, y + self.row_height - 5)
+            if previous is None or previous[1] != value:
+                canvas.itemconfig(value_item, text=self.display_func(value))
+            if previous is None or previous[2] != highlighted:
+                canvas.itemconfig(row, fill=SELECTED_TILE_COLOR if highlighted else EMPTY_TILE_BG)
+            self.shown[p] = state
+
+
 class LeaderboardGUI(tk.Toplevel):
     def __init__(self, parent, game):
         super().__init__(parent)
@@ -9,84 +103,27 @@ class LeaderboardGUI(tk.Toplevel):
         self.game = game
         self.content_frame = tk.Frame(self, bg=DARK_BG)
         self.content_frame.pack(padx=10, pady=10, fill="both")
+        self.sections = []
+        for category, title, header_text, data_func, display_func in LEADERBOARD_CATEGORIES:
+            tk.Label(self.content_frame, text=title, bg=DARK_BG, fg=DARK_FG,
+                     font=FONT_HEADER).pack(pady=5)
+            self.sections.append(LeaderboardSection(self.content_frame, self.game.players, header_text,
+                                                    data_func, display_func, self.on_row_click))
         self.update_content()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def update_content(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        tk.Label(self.content_frame, text="Money Leaderboard", bg=DARK_BG, fg=DARK_FG,
-                 font=FONT_HEADER).pack(pady=5)
-        self.create_section(self.content_frame, category="money")
-        tk.Label(self.content_frame, text="Upgrades Leaderboard", bg=DARK_BG, fg=DARK_FG,
-                 font=FONT_HEADER).pack(pady=5)
-        self.create_section(self.content_frame, category="upgrades")
-        tk.Label(self.content_frame, text="Total Mined Leaderboard", bg=DARK_BG, fg=DARK_FG,
-                 font=FONT_HEADER).pack(pady=5)
-        self.create_section(self.content_frame, category="mined")
-        tk.Label(self.content_frame, text="Robot Turn Earnings Leaderboard", bg=DARK_BG, fg=DARK_FG,
-                 font=FONT_HEADER).pack(pady=5)
-        self.create_section(self.content_frame, category="robot_money")
-
-    def create_section(self, parent, category):
-        canvas_width = 400
-        row_height = 35
-        header_height = 30
-        if category == "money":
-            header_text = "Money"
-            data_func = lambda p: p.money
-            display_func = lambda val: f"${val:.0f}"
-        elif category == "upgrades":
-            header_text = "Upgrades"
-            data_func = lambda p: p.upgrades_purchased
-            display_func = lambda val: str(val)
-        elif category == "mined":
-            header_text = "Total Mined"
-            data_func = lambda p: p.total_mined
-            display_func = lambda val: str(val)
-        elif category == "robot_money":
-            header_text = "Turn robot earnings"
-            data_func = lambda p: p.money_earned_by_robots
-            display_func = lambda val: f"${val:.0f}"
-        else:
-            return
-        players = sorted(self.game.players, key=data_func, reverse=True)
-        num_players = len(players)
-        canvas_height = header_height + row_height * num_players + 10
-        canvas = tk.Canvas(parent, width=canvas_width, height=canvas_height,
-                           bg=DARK_BG, highlightthickness=0)
-        canvas.pack(pady=5)
-        col_positions = [10, 100, 250]
-        headers = ["Player", header_text, "Bar Chart"]
-        for i, h in enumerate(headers):
-            canvas.create_text(col_positions[i], 15, anchor="w", text=h,
-                               fill=DARK_FG, font=FONT_SMALL)
-        max_value = max(data_func(p) for p in players) if players else 1
-        for idx, p in enumerate(players):
-            y = header_height + idx * row_height
-            row_tag = f"{category}_row_{idx}"
-            row_bg = SELECTED_TILE_COLOR if hasattr(self.master, "selected_tile") and self.master.selected_tile == (p.x, p.y) else EMPTY_TILE_BG
-            canvas.create_rectangle(5, y, canvas_width - 5, y + row_height,
-                                    fill=row_bg, outline="", tags=row_tag)
-            canvas.tag_bind(row_tag, "<Button-1>",
-                            lambda event, px=p.x, py=p.y: self.on_row_click(px, py))
-            canvas.create_text(col_positions[0], y + row_height / 2, anchor="w",
-                               text=p.symbol, fill=p.color, font=FONT_SMALL, tags=row_tag)
-            value = data_func(p)
-            canvas.create_text(col_positions[1], y + row_height / 2, anchor="w",
-                               text=display_func(value), fill=p.color, font=FONT_SMALL, tags=row_tag)
-            bar_x = col_positions[2]
-            bar_y = y + 5
-            max_bar_length = canvas_width - bar_x - 20
-            bar_length = (value / max_value) * max_bar_length if max_value > 0 else 0
-            canvas.create_rectangle(bar_x, bar_y, bar_x + bar_length, bar_y + row_height - 10,
-                                    fill=p.color, outline=p.color, tags=row_tag)
+        selected_tile = getattr(self.master, "selected_tile", None)
+        for section in self.sections:
+            section.refresh(selected_tile)
 
     def on_row_click(self, x, y):
         self.master.selected_tile = (x, y)
-        if hasattr(self.master, "update_display"):
-            self.master.update_display()
-        self.update_content()
+        if hasattr(self.master, "request_redraw"):
+            # The coalesced redraw refreshes this window too, since the selection changed.
+            self.master.request_redraw()
+        else:
+            self.update_content()
 
     def on_close(self):
         self.destroy()
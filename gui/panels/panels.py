@@ -1,7 +1,12 @@
 import tkinter as tk
+
+import numpy as np
+
 from constants import *
-# Make sure to import your module classes:
-from gameplay.modules import Drill, Reactor, Telescope, Factory, LaunchBay, IcePenetrator, FusionReactor, ExplosivesLab, WarpDrive
+from gameplay.asteroid import NO_OWNER
+from gameplay.events import RESOURCE_CHANGED, ROBOT_CHANGED, DISCOVERY_CHANGED
+from gameplay.modules import MODULE_CATALOG, MODULE_BUILD_COSTS
+from gui.assets import ASSETS
 
 
 
@@ -22,21 +27,8 @@ class UpgradeGUI(tk.Toplevel):
         self.configure(bg=DARK_BG)
         self.game = game
         self.player = player  # Player now has a list: self.modules
-        # To keep image references (to avoid garbage collection)
-        self.image_cache = {}
         # Dictionary mapping module names to a lambda that returns a new instance.
-        # (These default values can be adjusted as needed.)
-        self.available_modules = {
-            "Drill": lambda: Drill(mining_capacity=10, upgrade_cost=500, upgrade_increment=5, cost_increase=200),
-            "Reactor": lambda: Reactor(movement_range=5, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
-            "Telescope": lambda: Telescope(discovery_range=3, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
-            "Factory": lambda: Factory(robot_capacity=2, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
-            "LaunchBay": lambda: LaunchBay(robot_range=2, upgrade_cost=500, upgrade_increment=1, cost_increase=200),
-            "IcePenetrator": lambda: IcePenetrator(),
-            "NERVA": lambda: FusionReactor(),
-            "ExplosivesLab": lambda: ExplosivesLab(),
-            "WarpDrive": lambda: WarpDrive(),
-        }
+        self.available_modules = MODULE_CATALOG
         self.create_widgets()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
@@ -147,11 +139,10 @@ class UpgradeGUI(tk.Toplevel):
         # Only list modules that the player does not yet own.
         owned_module_names = {module.name for module in self.player.modules}
         row_index = 1
-        for module_name, constructor in self.available_modules.items():
+        for module_name in self.available_modules:
             if module_name not in owned_module_names:
-                # Create a temporary module instance (for display purposes).
-                temp_module = constructor()
-                img = self.get_module_image(temp_module)
+                # A new module starts at level 1.
+                img = ASSETS.module_tk(module_name, 1)
                 # Column 0: Module name (with image).
                 lbl_name = tk.Label(
                     self.purchase_frame, image=img, compound="left", text=module_name,
@@ -177,60 +168,22 @@ class UpgradeGUI(tk.Toplevel):
                 row_index += 1
 
     def get_cost_of_module(self, module_name):
-        temp_module = self.available_modules[module_name]()
-        return temp_module.build_cost
+        return MODULE_BUILD_COSTS[module_name]
 
     def buy_module(self, module_name):
         """
-        Buys a new module of the given type if the player has at least $1000.
+        Buys a new module of the given type if the player can afford it and has a free slot.
         """
-        cost = self.get_cost_of_module(module_name)
-        if len(self.player.modules) < 8:
-            if self.player.money >= cost:
-                self.player.money -= cost
-                new_module = self.available_modules[module_name]()
-                self.player.modules.append(new_module)
-                self.master.log(f"Purchased {module_name} for ${cost}.")
-                self.master.update_display()
-                self.build_purchase_table()
-                self.build_table()
-            else:
-                self.master.log("Insufficient funds to purchase module.")
-        else:
-            self.master.log("No available slot for the module.")
+        result = self.master.engine.buy_module(module_name)
+        self.master.log_records(result.records)
+        if result.success:
+            self.master.request_redraw()
+            self.build_purchase_table()
+            self.build_table()
 
     def get_module_image(self, module):
-        """
-        Determines and loads the image for the module based on its type and level.
-        For new modules (IcePenetrator, FusionReactor, ExplosivesLab, WarpDrive) we use
-        the specific filenames (e.g. "Ice_penetrator.png"). For the others, we follow the
-        existing naming convention.
-        """
-        mod_name = module.name
-        # Special handling for new modules:
-        if mod_name.lower() in ["icepenetrator", "nerva", "explosiveslab", "warpdrive"]:
-            mapping = {
-                "icepenetrator": "Ice_penetrator",
-                "nerva": "NERVA",
-                "explosiveslab": "Explosives_lab",
-                "warpdrive": "Warp_drive",
-            }
-            if module.level == 1:
-                filename = mapping[mod_name.lower()] + ".png"
-            else:
-                filename = mapping[mod_name.lower()] + "_upgrade.png"
-        else:
-            if mod_name.lower() == "launchbay":
-                filename = f"Launch_Bay{module.level}.png"
-            else:
-                filename = f"{mod_name}{module.level}.png"
-        # Try to load the image; fall back to "Blank.png" if needed.
-        try:
-            img = tk.PhotoImage(file=f"gui/modules/{filename}")
-        except Exception:
-            img = tk.PhotoImage(file="gui/modules/Blank.png")
-        self.image_cache[filename] = img
-        return img
+        """Returns the (cached) Tk image of the module at its current level."""
+        return ASSETS.module_tk(module.name, module.level)
 
     def get_description(self, module):
         """
@@ -262,15 +215,12 @@ class UpgradeGUI(tk.Toplevel):
 
     def upgrade_module(self, module):
         """
-        Upgrades the selected module by calling its own upgrade method.
-        If successful, logs the message, increments the player's upgrades_purchased,
-        and refreshes the table.
+        Upgrades the selected module through the game engine,
+        logs the outcome and refreshes the table.
         """
-        success, message = module.upgrade(self.player)
-        if success:
-            self.player.upgrades_purchased += 1
-        self.master.log(message)
-        self.master.update_display()
+        result = self.master.engine.upgrade_module(module)
+        self.master.log_records(result.records)
+        self.master.request_redraw()
         self.build_table()
 
     def remove_module(self, module):
@@ -278,9 +228,9 @@ class UpgradeGUI(tk.Toplevel):
         Removes the given module from the player's modules list.
         (Be aware that removal of a module means the player loses that capability.)
         """
-        self.player.modules.remove(module)
-        self.master.log(f"{module.name} has been removed from your modules.")
-        self.master.update_display()
+        result = self.master.engine.remove_module(module)
+        self.master.log_records(result.records)
+        self.master.request_redraw()
         self.build_table()
 
     def on_close(self):
@@ -291,6 +241,17 @@ class UpgradeGUI(tk.Toplevel):
 
 
 class AsteroidGraphGUI(tk.Toplevel):
+    """
+    Stats of every discovered, active asteroid as a virtualized table: only visible_rows
+    rows of canvas items exist and are re-filled as the list scrolls. Clicking the Res,
+    Price, Tot. Val or Robot header sorts by that column (clicking again reverses it).
+    """
+    visible_rows = 15
+    headers = ["Asteroid", "Loc", "Res", "Price", "Tot. Val", "Players", "Robot (Cap)"]
+    col_positions = [10, 70, 120, 170, 230, 290, 380, 480]
+    # header index -> sort key
+    sortable_columns = {2: "resource", 3: "price", 4: "total_value", 6: "robot_owner"}
+
     def __init__(self, parent, game):
         super().__init__(parent)
         self.title("Asteroid Stats")
@@ -300,82 +261,225 @@ class AsteroidGraphGUI(tk.Toplevel):
         self.row_height = 35
         self.header_height = 30
         self.show_resource_bar = True
+        self.sort_key = "id"
+        self.sort_descending = False
+        self.sorted_order = None  # (sort key, descending) that self.rows and self.row_keys are sorted by
+        self.rows = np.zeros(0, dtype=np.intp)  # field rows of the listed asteroids, in display order
+        self.row_keys = np.zeros(0)  # ascending sort key of each entry of self.rows
+        self.dirty_cells = set()  # tiles whose asteroid may have changed since the last sort
+        self.unsubscribe = game.events.subscribe(lambda event: self.dirty_cells.update(event.cells),
+                                                 kinds=(RESOURCE_CHANGED, ROBOT_CHANGED, DISCOVERY_CHANGED))
+        self.first_row = 0  # index into self.rows of the top visible row
         button_frame = tk.Frame(self, bg=DARK_BG)
         button_frame.pack(pady=5)
         self.toggle_button = tk.Button(button_frame, text="Show Total Value Bar", command=self.toggle_bar_chart,
                                        bg=BUTTON_BG, fg=BUTTON_FG, font=FONT_SMALL)
         self.toggle_button.pack()
-        self.canvas = tk.Canvas(self, width=self.canvas_width, height=300, bg=DARK_BG, highlightthickness=0)
-        self.canvas.pack(padx=10, pady=10, fill="both", expand=True)
+        self.summary_label = tk.Label(self, bg=DARK_BG, fg=DARK_FG, font=FONT_SMALL, justify="left")
+        self.summary_label.pack(padx=10, anchor="w")
+        table_frame = tk.Frame(self, bg=DARK_BG)
+        table_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        canvas_height = self.header_height + self.row_height * self.visible_rows + 10
+        self.canvas = tk.Canvas(table_frame, width=self.canvas_width, height=canvas_height,
+                                bg=DARK_BG, highlightthickness=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(table_frame, orient="vertical", command=self.on_scroll)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<MouseWheel>", lambda e: self.scroll_by(-1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_by(-1))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_by(1))
+        self.create_items()
         self.update_content()
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
+    def create_items(self):
+        """Creates the header and the pool of visible_rows rows; items are only reconfigured afterwards."""
+        self.header_items = []
+        for i, header in enumerate(self.headers + ["Resource"]):
+            item = self.canvas.create_text(self.col_positions[i], 15, anchor="w", text=header, fill=DARK_FG,
+                                           font=FONT_SMALL, tags=f"header_{i}")
+            if i in self.sortable_columns:
+                self.canvas.tag_bind(f"header_{i}", "<Button-1>", lambda e, i=i: self.sort_by(self.sortable_columns[i]))
+            self.header_items.append(item)
+        self.row_items = []  # slot -> (background, [column texts], bar)
+        self.shown_rows = [None] * self.visible_rows  # slot -> values currently drawn
+        for slot in range(self.visible_rows):
+            y = self.header_height + slot * self.row_height
+            row_tag = f"slot_{slot}"
+            background = self.canvas.create_rectangle(5, y, self.canvas_width - 5, y + self.row_height,
+                                                      fill=ASTEROID_BG, outline="", state="hidden", tags=row_tag)
+            texts = [self.canvas.create_text(x, y + self.row_height / 2, anchor="w", text="", fill=DARK_FG,
+                                             font=FONT_SMALL, state="hidden", tags=row_tag)
+                     for x in self.col_positions[:len(self.headers)]]
+            bar = self.canvas.create_rectangle(0, 0, 0, 0, outline="white", state="hidden", tags=row_tag)
+            self.canvas.tag_bind(row_tag, "<Button-1>", lambda e, slot=slot: self.on_slot_click(slot))
+            self.row_items.append((background, texts, bar))
+
     def toggle_bar_chart(self):
         self.show_resource_bar = not self.show_resource_bar
         self.toggle_button.config(text="Show Total Value" if self.show_resource_bar else "Show Resource")
         self.update_content()
 
+    def sort_by(self, key):
+        if self.sort_key == key:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_key = key
+            # Amounts read best largest first; robot owners in player order.
+            self.sort_descending = key != "robot_owner"
+        self.first_row = 0
+        self.update_content()
+
+    def update_summary(self):
+        """Shows the game's running totals over all active asteroids (discovered or not)."""
+        game = self.game
+        lines = [f"Active asteroids: {game.active_asteroid_count}   "
+                 f"Remaining resource: {game.remaining_resource:.0f}   "
+                 f"Remaining value: ${game.remaining_value:.0f}"]
+        for name, (count, resource, value) in game.get_type_totals().items():
+            lines.append(f"  {name}: {count} active, {resource:.0f} res, ${value:.0f}")
+        self.summary_label.config(text="\n".join(lines))
+
+    def sort_keys(self, rows):
+        """Ascending sort keys of the given field rows for the current sort column and direction."""
+        field = self.game.asteroid_field
+        if self.sort_key == "resource":
+            keys = field.column("resource")[rows]
+        elif self.sort_key == "price":
+            keys = field.column("value")[rows]
+        elif self.sort_key == "total_value":
+            keys = field.column("resource")[rows] * field.column("value")[rows]
+        elif self.sort_key == "robot_owner":
+            owners = field.column("robot_owner")[rows].astype(np.int64)
+            keys = np.where(owners == NO_OWNER, len(self.game.players), owners)  # unowned last
+        else:
+            keys = rows
+        keys = np.asarray(keys, dtype=np.float64)
+        return -keys if self.sort_descending else keys
+
+    def listed(self, rows):
+        """Mask of the given field rows that belong in the table (discovered and active)."""
+        field = self.game.asteroid_field
+        return (field.column("resource")[rows] > 0) & self.game.layers.discovered[field.column("x")[rows],
+                                                                                   field.column("y")[rows]]
+
+    def get_sorted_rows(self):
+        """
+        Field rows of the discovered, active asteroids in display order (ties by field row).
+        Sorted in full only when the sort column or direction changes; otherwise only the
+        asteroids on tiles named by RESOURCE_CHANGED, ROBOT_CHANGED and DISCOVERY_CHANGED
+        events are removed and re-inserted at their new position.
+        """
+        order = (self.sort_key, self.sort_descending)
+        dirty = [self.game.get_asteroid_at(x, y) for x, y in self.dirty_cells]
+        self.dirty_cells.clear()
+        dirty_rows = np.array(sorted({a.index for a in dirty if a is not None}), dtype=np.intp)
+        if self.sorted_order != order or len(dirty_rows) > len(self.rows) // 4:
+            # Re-inserting many rows one by one costs more than sorting once.
+            rows = np.flatnonzero(self.listed(np.arange(self.game.asteroid_field.count, dtype=np.intp)))
+            keys = self.sort_keys(rows)
+            sort = np.argsort(keys, kind="stable")
+            self.rows, self.row_keys = rows[sort], keys[sort]
+            self.sorted_order = order
+            return self.rows
+        if len(dirty_rows):
+            keep = ~np.isin(self.rows, dirty_rows)
+            rows, keys = self.rows[keep], self.row_keys[keep]
+            dirty_rows = dirty_rows[self.listed(dirty_rows)]
+            for row, key in zip(dirty_rows.tolist(), self.sort_keys(dirty_rows).tolist()):
+                lo = np.searchsorted(keys, key, side="left")
+                hi = np.searchsorted(keys, key, side="right")
+                position = lo + np.searchsorted(rows[lo:hi], row)
+                rows = np.insert(rows, position, row)
+                keys = np.insert(keys, position, key)
+            self.rows, self.row_keys = rows, keys
+        return self.rows
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first_row = int(float(amount) * len(self.rows))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.first_row += int(amount) * step
+        self.update_content()
+
+    def scroll_by(self, amount):
+        self.on_scroll("scroll", amount, "units")
+
     def update_content(self):
-        discovered = [a for a in self.game.asteroids if (a.x, a.y) in self.game.discovered_tiles]
-        total_height = self.header_height + self.row_height * len(discovered) + 20
-        self.canvas.config(height=total_height)
-        self.canvas.delete("all")
-        headers = ["Asteroid", "Loc", "Res", "Price", "Tot. Val", "Players", "Robot (Cap)",
-                   "Resource" if self.show_resource_bar else "Value"]
-        col_positions = [10, 70, 120, 170, 230, 290, 380, 480]
-        for i, header in enumerate(headers):
-            self.canvas.create_text(col_positions[i], 15, anchor="w", text=header, fill=DARK_FG,
-                                    font=FONT_SMALL)
-        y = self.header_height
-        if self.show_resource_bar:
-            max_bar_value = max(a.resource for a in discovered) if discovered else 1
+        self.update_summary()
+        game = self.game
+        field = game.asteroid_field
+        self.rows = self.get_sorted_rows()
+        count = len(self.rows)
+        self.first_row = max(0, min(self.first_row, count - self.visible_rows))
+        if count:
+            self.scrollbar.set(self.first_row / count, min(1.0, (self.first_row + self.visible_rows) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.canvas.itemconfig(self.header_items[-1], text="Resource" if self.show_resource_bar else "Value")
+        resources = field.column("resource")[self.rows]
+        bar_values = resources if self.show_resource_bar else resources * field.column("value")[self.rows]
+        max_bar_value = float(bar_values.max()) if count else 1
+        bar_x = self.col_positions[7]
+        max_bar_length = self.canvas_width - bar_x - 20
+        current = game.get_current_player()
+        for slot in range(self.visible_rows):
+            index = self.first_row + slot
+            if index >= count:
+                self.show_slot(slot, None)
+                continue
+            a = game.asteroids[self.rows[index]]
+            if self.master.selected_tile == (a.x, a.y):
+                fill_color = SELECTED_TILE_COLOR
+            elif (a.x, a.y) == (current.x, current.y):
+                fill_color = ACTIVE_PLAYER_TILE_COLOR
+            else:
+                fill_color = ASTEROID_BG
+            robot = a.robot
+            total_val = a.resource * a.value
+            texts = (f"{'(??) ' if not a.visited else ''}A{a.id}",
+                     f"({a.x},{a.y})",
+                     f"{a.resource:.0f}",
+                     f"${a.value:.2f}",
+                     f"${total_val:.2f}",
+                     ", ".join(p.symbol for p in game.get_players_at(a.x, a.y)),
+                     f"{robot.owner.symbol} (Cap: {robot.capacity})" if robot else "")
+            bar_val = a.resource if self.show_resource_bar else total_val
+            bar_length = (bar_val / max_bar_value) * max_bar_length if max_bar_value > 0 else 0
+            row_color = robot.owner.color if robot else DARK_FG
+            self.show_slot(slot, (fill_color, texts, row_color, bar_length, a.color))
+
+    def show_slot(self, slot, values):
+        """Fills pool row slot with values (or hides it for None), touching the canvas only on change."""
+        if self.shown_rows[slot] == values:
+            return
+        background, texts, bar = self.row_items[slot]
+        if values is None:
+            for item in [background, bar] + texts:
+                self.canvas.itemconfig(item, state="hidden")
         else:
-            max_bar_value = max(a.resource * a.value for a in discovered) if discovered else 1
-        for a in discovered:
-            if not a.is_exhausted():
-                _, fill_color, _ = self.master.game.get_base_tile_properties(a.x, a.y, self.master.game.get_current_player())
-                if fill_color not in [SELECTED_TILE_COLOR, ACTIVE_PLAYER_TILE_COLOR]:
-                    fill_color = ASTEROID_BG
-                if self.master.selected_tile == (a.x,a.y):
-                    fill_color = SELECTED_TILE_COLOR
-                row_tag = f"asteroid_{a.id}"
-                self.canvas.create_rectangle(5, y, self.canvas_width - 5, y + self.row_height, fill=fill_color,
-                                             outline="", tags=row_tag)
-                self.canvas.tag_bind(row_tag, "<Button-1>", lambda e, ax=a.x, ay=a.y: self.on_row_click(ax, ay))
-                row_color = a.robot.owner.color if a.robot else DARK_FG
-                self.canvas.create_text(col_positions[0], y + self.row_height / 2, anchor="w",
-                                        text=f"{'(??) ' if not a.visited else ''}A{a.id}", fill=row_color, font=FONT_SMALL, tags=row_tag)
-                self.canvas.create_text(col_positions[1], y + self.row_height / 2, anchor="w",
-                                        text=f"({a.x},{a.y})", fill=row_color, font=FONT_SMALL, tags=row_tag)
-                self.canvas.create_text(col_positions[2], y + self.row_height / 2, anchor="w",
-                                        text=f"{a.resource:.0f}", fill=row_color, font=FONT_SMALL, tags=row_tag)
-                self.canvas.create_text(col_positions[3], y + self.row_height / 2, anchor="w",
-                                        text=f"${a.value:.2f}", fill=row_color, font=FONT_SMALL, tags=row_tag)
-                total_val = a.resource * a.value
-                self.canvas.create_text(col_positions[4], y + self.row_height / 2, anchor="w",
-                                        text=f"${total_val:.2f}", fill=row_color, font=FONT_SMALL, tags=row_tag)
-                players_here = [p for p in self.game.players if p.x == a.x and p.y == a.y]
-                players_text = ", ".join(p.symbol for p in players_here)
-                self.canvas.create_text(col_positions[5], y + self.row_height / 2, anchor="w",
-                                        text=players_text, fill=row_color, font=FONT_SMALL, tags=row_tag)
-                robot_text = f"{a.robot.owner.symbol} (Cap: {a.robot.capacity})" if a.robot else ""
-                self.canvas.create_text(col_positions[6], y + self.row_height / 2, anchor="w",
-                                        text=robot_text, fill=row_color, font=FONT_SMALL, tags=row_tag)
-                bar_x = col_positions[7]
-                bar_y = y + 5
-                max_bar_length = self.canvas_width - bar_x - 20
-                bar_val = a.resource if self.show_resource_bar else total_val
-                bar_length = (bar_val / max_bar_value) * max_bar_length if max_bar_value > 0 else 0
-                self.canvas.create_rectangle(bar_x, bar_y, bar_x + bar_length, bar_y + self.row_height - 10,
-                                             fill=a.color, outline="white", tags=row_tag)
-                y += self.row_height
+            fill_color, column_texts, row_color, bar_length, bar_color = values
+            self.canvas.itemconfig(background, fill=fill_color, state="normal")
+            for item, text in zip(texts, column_texts):
+                self.canvas.itemconfig(item, text=text, fill=row_color, state="normal")
+            y = self.header_height + slot * self.row_height
+            bar_x = self.col_positions[7]
+            self.canvas.coords(bar, bar_x, y + 5, bar_x + bar_length, y + self.row_height - 5)
+            self.canvas.itemconfig(bar, fill=bar_color, state="normal")
+        self.shown_rows[slot] = values
+
+    def on_slot_click(self, slot):
+        index = self.first_row + slot
+        if index < len(self.rows):
+            a = self.game.asteroids[self.rows[index]]
+            self.on_row_click(a.x, a.y)
 
     def on_row_click(self, x, y):
         self.master.selected_tile = (x, y)
-        self.master.update_display()
+        self.master.request_redraw()
 
     def on_close(self):
+        self.unsubscribe()
         self.destroy()
         self.master.asteroid_stats_window = None
-
-
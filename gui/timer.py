@@ -0,0 +1,114 @@
+import math
+import time
+
+from constants import TIMER_DELAY_MS
+
+
+# ----------------------------------------------------------------------
+# Turn timer
+# The turn ends at a time.monotonic() deadline, not after a number of callbacks, so slow
+# frames never stretch a turn. Exactly one Tk callback is scheduled at a time; it fires
+# when the displayed whole second changes (or the deadline passes).
+# ----------------------------------------------------------------------
+class TurnTimer:
+    """
+    Countdown of duration seconds per turn, driven by widget.after().
+      - on_expire(): called once when the deadline passes; the timer has already restarted.
+      - on_tick(): called whenever the displayed seconds (seconds_left()) may have changed.
+    The timer runs while no pause reason is set (see pause/resume), and keeps the exact
+    remaining time while paused.
+    """
+    def __init__(self, widget, duration, on_expire, on_tick, clock=time.monotonic):
+        self.widget = widget
+        self.duration = duration
+        self.on_expire = on_expire
+        self.on_tick = on_tick
+        self.clock = clock
+        self.pause_reasons = set()
+        self.remaining = duration  # seconds left when paused or not started
+        self.deadline = None  # clock() value at which the turn ends, None unless running
+        self.after_id = None
+        self.stopped = True
+
+    @property
+    def paused(self):
+        return bool(self.pause_reasons)
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    def time_left(self):
+        if self.deadline is None:
+            return self.remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def seconds_left(self):
+        """Whole seconds to display (rounded up, so 0 is only shown once the turn ended)."""
+        return math.ceil(self.time_left())
+
+    def start(self):
+        """Starts a full turn; also used to restart it when a new turn begins."""
+        self.stopped = False
+        self.remaining = self.duration
+        self.deadline = None
+        self._update()
+
+    def stop(self):
+        """Stops the timer for good (e.g. the game is over)."""
+        self.remaining = self.time_left()
+        self.deadline = None
+        self.stopped = True
+        self._cancel()
+        self.on_tick()
+
+    def pause(self, reason="user"):
+        if reason in self.pause_reasons:
+            return
+        self.pause_reasons.add(reason)
+        self._update()
+
+    def resume(self, reason="user"):
+        if reason not in self.pause_reasons:
+            return
+        self.pause_reasons.discard(reason)
+        self._update()
+
+    def _update(self):
+        """Brings deadline and the scheduled callback in line with the paused/stopped state."""
+        if self.stopped or self.paused:
+            if self.deadline is not None:
+                self.remaining = self.time_left()
+                self.deadline = None
+            self._cancel()
+        elif self.deadline is None:
+            self.deadline = self.clock() + self.remaining
+            self._schedule()
+        self.on_tick()
+
+    def _cancel(self):
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _schedule(self):
+        self._cancel()
+        left = self.time_left()
+        # Wake up just after the displayed second changes, but at least every TIMER_DELAY_MS.
+        until_next_second = left - (math.ceil(left) - 1) if left > 0 else 0
+        delay_ms = min(TIMER_DELAY_MS, max(1, math.ceil(until_next_second * 1000)))
+        self.after_id = self.widget.after(delay_ms, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        if self.deadline is None:
+            return
+        if self.deadline - self.clock() <= 0:
+            # Restart before notifying, so on_expire can restart, pause or stop it again.
+            self.remaining = self.duration
+            self.deadline = self.clock() + self.duration
+            self._schedule()
+            self.on_expire()
+        else:
+            self._schedule()
+        self.on_tick()
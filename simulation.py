@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo balance testing.
+Plays many complete headless games with scripted strategies across a process pool.
+Every finished game is written to disk as one JSON line and folded into running statistics
+in game order, so results do not depend on the number of processes. Only a bounded window of
+jobs is in flight at a time, so even very large sweeps run in constant memory.
+
+Example:
+    python simulation.py --games 10000 --strategy greedy --strategy random \
+        --set grid_width=32 --set grid_height=32 --output results.jsonl
+"""
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+from collections import deque
+
+from settings import GameSettings
+from gameplay import Game, GameEngine
+from gameplay.rng import derive_seed
+from gameplay.strategies import STRATEGIES
+
+
+class RunningStats:
+    """Streaming count/mean/std/min/max (Welford's algorithm)."""
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def std(self):
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def as_dict(self):
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+
+class SimulationSummary:
+    """Aggregates per-game records without keeping them."""
+    def __init__(self, money_bucket=500):
+        self.games = 0
+        self.finished = 0
+        self.game_length = RunningStats()
+        self.money = RunningStats()
+        self.money_histogram = {}  # bucket start -> count
+        self.money_bucket = money_bucket
+        self.first_upgrade_turn = RunningStats()
+        self.upgrades = RunningStats()
+        self.robot_share = RunningStats()
+        self.wins = {}  # strategy -> games won
+        self.money_by_strategy = {}  # strategy -> RunningStats
+
+    def add(self, record):
+        self.games += 1
+        self.finished += record["finished"]
+        self.game_length.add(record["turns"])
+        winner = record["winner_strategy"]
+        self.wins[winner] = self.wins.get(winner, 0) + 1
+        for p in record["players"]:
+            self.money.add(p["money"])
+            bucket = int(p["money"] // self.money_bucket) * self.money_bucket
+            self.money_histogram[bucket] = self.money_histogram.get(bucket, 0) + 1
+            self.money_by_strategy.setdefault(p["strategy"], RunningStats()).add(p["money"])
+            self.upgrades.add(p["upgrades"])
+            if p["first_upgrade_turn"] is not None:
+                self.first_upgrade_turn.add(p["first_upgrade_turn"])
+            if p["robot_share"] is not None:
+                self.robot_share.add(p["robot_share"])
+
+    def as_dict(self):
+        return {
+            "games": self.games,
+            "finished": self.finished,
+            "game_length": self.game_length.as_dict(),
+            "money": self.money.as_dict(),
+            "money_histogram": dict(sorted(self.money_histogram.items())),
+            "money_by_strategy": {k: v.as_dict() for k, v in sorted(self.money_by_strategy.items())},
+            "wins": dict(sorted(self.wins.items())),
+            "upgrades": self.upgrades.as_dict(),
+            "first_upgrade_turn": self.first_upgrade_turn.as_dict(),
+            "robot_share_of_income": self.robot_share.as_dict(),
+        }
+
+
+def play_game(job):
+    """
+    Plays one complete game and returns a JSON-serialisable record.
+    job is (game_index, seed, strategy_names, settings_kwargs, max_turns).
+    """
+    game_index, seed, strategy_names, settings_kwargs, max_turns = job
+    game = Game(GameSettings(**settings_kwargs), seed=seed)
+    engine = GameEngine(game)
+    # Strategies get their own child streams so that their choices never shift the game's draws.
+    strategies = [STRATEGIES[strategy_names[i % len(strategy_names)]](random.Random(derive_seed(seed, i)))
+                  for i in range(len(game.players))]
+    while not engine.game_over and game.turn <= max_turns:
+        strategies[game.current_player_index].play_turn(engine)
+
+    players = []
+    for p, strategy in zip(game.players, strategies):
+        income = p.total_earned_by_robots + p.total_earned_by_mining
+        players.append({
+            "strategy": strategy.name,
+            "money": p.money,
+            "total_mined": p.total_mined,
+            "upgrades": p.upgrades_purchased,
+            "upgrade_turns": strategy.upgrade_turns,
+            "first_upgrade_turn": strategy.upgrade_turns[0] if strategy.upgrade_turns else None,
+            "robot_income": p.total_earned_by_robots,
+            "mining_income": p.total_earned_by_mining,
+            "robot_share": p.total_earned_by_robots / income if income > 0 else None,
+        })
+    winner = max(range(len(players)), key=lambda i: players[i]["money"])
+    return {
+        "game": game_index,
+        "seed": seed,
+        "turns": game.turn,
+        "finished": engine.game_over,
+        "winner": winner,
+        "winner_strategy": players[winner]["strategy"],
+        "players": players,
+    }
+
+
+def play_games(jobs):
+    """Plays a chunk of jobs in one worker call and returns their records in order."""
+    return [play_game(job) for job in jobs]
+
+
+def iter_jobs(num_games, strategy_names, settings_kwargs, max_turns, base_seed):
+    for i in range(num_games):
+        yield (i, derive_seed(base_seed, i), strategy_names, settings_kwargs, max_turns)
+
+
+def run_simulations(num_games, strategy_names, settings_kwargs=None, output_path=None,
+                    processes=None, max_turns=500, base_seed=0, chunksize=8):
+    """
+    Plays num_games games over a pool of processes (all cores by default).
+    Records are appended to output_path (JSON lines) and summarised in game-index order, so the
+    output and the summary are the same for any number of processes; returns the summary dict.
+    Jobs are submitted in chunks of chunksize, at most two chunks per process at a time.
+    """
+    settings_kwargs = settings_kwargs or {}
+    summary = SimulationSummary()
+    jobs = iter_jobs(num_games, list(strategy_names), settings_kwargs, max_turns, base_seed)
+    chunks = iter(lambda: list(itertools.islice(jobs, chunksize)), [])
+    window = 2 * (processes or os.cpu_count() or 1)
+    out = open(output_path, "w") if output_path else None
+
+    def collect(pending_chunk):
+        for record in pending_chunk.get():
+            summary.add(record)
+            if out is not None:
+                out.write(json.dumps(record) + "\n")
+        if out is not None:
+            out.flush()
+
+    try:
+        with multiprocessing.Pool(processes) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(play_games, (chunk,)))
+                if len(pending) >= window:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+    finally:
+        if out is not None:
+            out.close()
+    return summary.as_dict()
+
+
+def parse_setting(text):
+    key, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError(f"expected key=value, got {text!r}")
+    try:
+        return key, int(value)
+    except ValueError:
+        return key, float(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless Monte Carlo games for balance testing.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--strategy", action="append", choices=sorted(STRATEGIES),
+                        help="strategy per player seat (repeat; cycles over seats). Default: greedy")
+    parser.add_argument("--set", action="append", type=parse_setting, default=[], metavar="KEY=VALUE",
+                        help="GameSettings override (repeatable)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--max-turns", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="simulation_results.jsonl")
+    args = parser.parse_args()
+
+    summary = run_simulations(args.games, args.strategy or ["greedy"], dict(args.set),
+                              output_path=args.output, processes=args.processes,
+                              max_turns=args.max_turns, base_seed=args.seed)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()